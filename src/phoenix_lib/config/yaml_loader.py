@@ -1,16 +1,149 @@
 """YAML configuration loader shared across Phoenix services."""
 
+import copy
+import functools
+import json
 import logging
 import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 CONFIG_FILE_ENV_VAR = "APP_CONFIG_PATH"
 
+JSON_SIDECAR_SUFFIX = ".json"
+# Set to a truthy value ("1", "true", "yes", "on") to cache parsed YAML in
+# ``<path>.json`` sidecar files next to the source. Off by default.
+JSON_SIDECAR_ENV_VAR = "APP_CONFIG_JSON_SIDECAR"
+
+
+def json_sidecar_enabled() -> bool:
+    """Return True if JSON sidecar caching was opted into via the environment."""
+    flag = str(os.getenv(JSON_SIDECAR_ENV_VAR, "")).strip().lower()
+    return flag in {"1", "true", "yes", "on"}
+
+
+def read_json_sidecar(path_str: str, mtime_ns: int, size: int) -> Optional[Any]:
+    """Return the data cached in ``<path>.json`` if it matches the source file.
+
+    The sidecar records the ``mtime_ns`` and ``size`` of the YAML file it was
+    generated from; any mismatch (or an unreadable sidecar) returns ``None``
+    so the caller falls back to parsing the YAML.
+    """
+    try:
+        with open(path_str + JSON_SIDECAR_SUFFIX, "r", encoding="utf-8") as sidecar:
+            envelope = json.load(sidecar)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(envelope, dict)
+        or envelope.get("mtime_ns") != mtime_ns
+        or envelope.get("size") != size
+    ):
+        return None
+    return envelope.get("data")
+
+
+def write_json_sidecar(path_str: str, mtime_ns: int, size: int, data: Any) -> None:
+    """Best-effort write of parsed YAML data to a ``<path>.json`` sidecar.
+
+    Skipped when the data does not survive a JSON round-trip unchanged (e.g.
+    dates or non-string keys) and silently ignored on read-only filesystems.
+    The sidecar gets the source file's permission bits, since it holds the
+    same (possibly secret) values, and is written via a unique temp file so
+    concurrent writers never share one.
+    """
+    if data is None:
+        return
+    try:
+        payload = json.dumps(
+            {"mtime_ns": mtime_ns, "size": size, "data": data},
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        if json.loads(payload)["data"] != data:
+            return
+    except (TypeError, ValueError):
+        return
+
+    sidecar_path = path_str + JSON_SIDECAR_SUFFIX
+    tmp_path = None
+    try:
+        source_mode = stat.S_IMODE(os.stat(path_str).st_mode)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(sidecar_path),
+            prefix=os.path.basename(sidecar_path) + ".",
+            suffix=".tmp",
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as sidecar:
+            os.fchmod(sidecar.fileno(), source_mode)
+            sidecar.write(payload)
+        os.replace(tmp_path, sidecar_path)
+    except OSError as e:
+        logger.debug("Could not write JSON sidecar %s: %s", sidecar_path, e)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+@functools.lru_cache(maxsize=128)
+def load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoised on its path, mtime and size.
+
+    Shared by the config and prompt loaders. ``mtime_ns`` and ``size`` are only
+    part of the cache key: an edited file produces a new key and is re-parsed
+    on the next call. When JSON sidecars are enabled (``JSON_SIDECAR_ENV_VAR``),
+    a fresh sidecar is used instead of parsing the YAML. The returned object
+    is shared; callers must not mutate it.
+    """
+    use_sidecar = json_sidecar_enabled()
+    if use_sidecar:
+        data = read_json_sidecar(path_str, mtime_ns, size)
+        if data is not None:
+            return data
+    # One read hands libyaml the whole buffer; it detects the encoding itself.
+    data = yaml.load(Path(path_str).read_bytes(), Loader=_SafeLoader)
+    if use_sidecar:
+        write_json_sidecar(path_str, mtime_ns, size, data)
+    return data
+
+
+def clear_config_cache() -> None:
+    """Drop all parsed configs and prompts held in memory (JSON sidecars are kept)."""
+    load_yaml_cached.cache_clear()
+
+
+def _stat_first_file(
+    candidates: List[Path],
+) -> Optional[Tuple[Path, os.stat_result]]:
+    """Return the first candidate that is an existing file, with its stat.
+
+    One ``stat()`` per candidate replaces the former ``exists()`` checks, and
+    the result doubles as the parse-cache key. Like ``exists()``, any
+    ``OSError`` (missing file, symlink loop, permission denied) counts as
+    "not found".
+    """
+    for path in candidates:
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            continue
+        if not stat.S_ISDIR(path_stat.st_mode):
+            return path, path_stat
+    return None
+
 
 def load_yaml_config(
     local_path: Optional[Path] = None,
@@ -24,6 +157,8 @@ def load_yaml_config(
     3. ``local_path`` if provided (e.g. ``config/config.yaml`` relative to project)
 
     Returns an empty dict if no file is found or if the file is empty.
+    Parsed files are cached by ``(path, mtime, size)``, so repeated calls on an
+    unchanged file skip the read and parse.
 
     Args:
         local_path: Path to the local development config file.
@@ -34,28 +169,28 @@ def load_yaml_config(
     """
     config_file_env = os.getenv(CONFIG_FILE_ENV_VAR)
     if config_file_env:
-        config_path: Optional[Path] = Path(config_file_env)
-    elif docker_path and docker_path.exists():
-        config_path = docker_path
-    elif local_path:
-        config_path = local_path
+        candidates = [Path(config_file_env)]
     else:
-        config_path = None
+        candidates = [p for p in (docker_path, local_path) if p]
 
-    if config_path is None or not config_path.exists():
+    resolved = _stat_first_file(candidates)
+    if resolved is None:
         logger.debug("Config file not found, using defaults")
         return {}
+    config_path, config_stat = resolved
 
     try:
-        with open(config_path, "r", encoding="utf-8") as config_file:
-            config_data = yaml.safe_load(config_file)
+        config_data = load_yaml_cached(
+            str(config_path), config_stat.st_mtime_ns, config_stat.st_size
+        )
         if config_data is None:
             return {}
         logger.info("Loaded configuration from %s", config_path)
-        return config_data
+        # Callers may mutate the returned dict; never hand out the cached object.
+        return copy.deepcopy(config_data)
     except yaml.YAMLError as e:
         logger.error("Error parsing YAML config %s: %s", config_path, e)
         return {}
-    except IOError as e:
+    except OSError as e:
         logger.error("Error reading config file %s: %s", config_path, e)
         return {}
@@ -1,34 +1,53 @@
 """Shared async database engine factory for Phoenix services."""
 
-from typing import List, Optional, Tuple
+import functools
+from typing import List, Optional, Tuple, Union
 
 from sqlalchemy.engine import URL
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 
+def _dialect_of(url: URL) -> str:
+    driver = (url.drivername or "").lower()
+    if driver.startswith("postgres"):
+        return "postgresql"
+    if driver.startswith("mysql"):
+        return "mysql"
+    if driver.startswith("sqlite"):
+        return "sqlite"
+    return driver
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    """Return True for in-memory SQLite URLs, which get a ``StaticPool``."""
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+@functools.lru_cache(maxsize=32)
 def detect_dialect(dsn: str) -> Tuple[str, URL]:
     """Parse a DSN string and return a normalised dialect name plus the parsed URL.
 
+    Results are memoised per DSN string; ``URL`` objects are immutable, so the
+    cached instance is safe to share.
+
     Returns:
         Tuple of (dialect, URL) where dialect is one of "postgresql", "mysql",
         "sqlite", or the raw drivername prefix for unknown drivers.
     """
     url = make_url(dsn)
-    driver = (url.drivername or "").lower()
-    if driver.startswith("postgres"):
-        return "postgresql", url
-    if driver.startswith("mysql"):
-        return "mysql", url
-    if driver.startswith("sqlite"):
-        return "sqlite", url
-    return driver, url
+    return _dialect_of(url), url
 
 
 def create_async_engine_from_dsn(
-    dsn: str,
+    dsn: Union[str, URL],
     echo: bool = False,
     extensions: Optional[List[str]] = None,
+    pool_pre_ping: bool = True,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_recycle: int = 1800,
+    pool_timeout: int = 30,
 ) -> AsyncEngine:
     """Create an ``AsyncEngine`` from a DSN string.
 
@@ -37,8 +56,15 @@ def create_async_engine_from_dsn(
     - PostgreSQL with ``extensions=["vector"]``: pgvector is enabled after
       first connection (caller is responsible for running the DDL).
 
+    Pool sizing arguments (``pool_size``, ``max_overflow``, ``pool_timeout``)
+    apply to server databases and file-backed SQLite. In-memory SQLite
+    engines use a single-connection ``StaticPool``, which rejects them, so
+    they are not passed there. At high concurrency, size the
+    pool so that ``(pool_size + max_overflow) * replicas`` stays below the
+    server's connection limit.
+
     Args:
-        dsn: Database DSN / URL string.
+        dsn: Database DSN / URL string, or an already parsed ``URL``.
         echo: If True, SQL statements are logged (useful for debugging).
         extensions: Optional list of PostgreSQL extensions required by this service
             (e.g. ``["vector"]`` for pgvector).  Declaring them here makes the
@@ -46,22 +72,44 @@ def create_async_engine_from_dsn(
             the actual DDL (``CREATE EXTENSION IF NOT EXISTS <name>``) before the
             first table-creation step — conventionally inside a ``create_tables()``
             startup function.
+        pool_pre_ping: Test connections with a lightweight ping on checkout.
+            Disable to save a round-trip per checkout when stale connections
+            are already handled by ``pool_recycle``.
+        pool_size: Number of connections kept open in the pool.
+        max_overflow: Connections allowed beyond ``pool_size`` under load.
+        pool_recycle: Seconds after which a pooled connection is replaced.
+            Use ``-1`` to disable recycling.
+        pool_timeout: Seconds to wait for a connection before giving up.
 
     Returns:
         Configured ``AsyncEngine`` instance.
     """
-    dialect, url = detect_dialect(dsn if isinstance(dsn, str) else str(dsn))
+    if isinstance(dsn, URL):
+        url = dsn
+        dialect = _dialect_of(url)
+    else:
+        dialect, url = detect_dialect(str(dsn))
 
     connect_args = {}
-    if dialect == "sqlite" or (url.drivername or "").startswith("sqlite"):
+    pool_kwargs = {}
+    is_sqlite = dialect == "sqlite" or (url.drivername or "").startswith("sqlite")
+    if is_sqlite:
         connect_args = {"check_same_thread": False}
+    if not (is_sqlite and _is_sqlite_memory(url)):
+        pool_kwargs = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+        }
 
-    # IMPORTANT: str(URL) hides passwords as "***", which breaks authentication.
-    # Render explicitly with hide_password=False for actual connection DSNs.
+    # Pass the URL object itself: it is not re-parsed, and unlike str(URL) it
+    # does not mask the password as "***".
     engine = create_async_engine(
-        url.render_as_string(hide_password=False),
+        url,
         echo=echo,
-        pool_pre_ping=True,
+        pool_pre_ping=pool_pre_ping,
+        pool_recycle=pool_recycle,
         connect_args=connect_args,
+        **pool_kwargs,
     )
     return engine
@@ -33,8 +33,13 @@ class BaseUnitOfWork:
 
         async with MyUnitOfWork() as uow:
             user = await uow.users.get(user_id)
+
+    The base state lives in ``__slots__``; subclasses may declare their own
+    ``__slots__`` for their repository attributes or simply use ``__dict__``.
     """
 
+    __slots__ = ("_injected_session", "_session", "_owns_session", "__weakref__")
+
     def __init__(self, session: Optional[AsyncSession] = None):
         # A session provided at construction time (e.g. from tests)
         self._injected_session = session
@@ -2,33 +2,124 @@
 
 # pylint: disable=import-error,no-name-in-module
 
-import os
-from typing import Any, Dict, Optional, Union
-
-try:
-    import langfuse as langfuse_module  # pylint: disable=invalid-name
-except Exception:  # pylint: disable=broad-exception-caught
-    langfuse_module = None  # pylint: disable=invalid-name
-
-from langchain_core.prompts import PromptTemplate
-from langchain_litellm import ChatLiteLLM
-
-try:
-    from langfuse.langchain import \
-        CallbackHandler as \
-        callback_handler_cls  # type: ignore; pylint: disable=invalid-name
-except Exception:  # pylint: disable=broad-exception-caught
-    callback_handler_cls = None  # pylint: disable=invalid-name
+from __future__ import annotations
 
+import functools
 import logging
+import os
+from collections import OrderedDict
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional,
+                    Tuple, Union)
 
 from phoenix_lib.llm.config import LLMConfig
 from phoenix_lib.llm.prompts import PromptLoader
 from phoenix_lib.llm.utils import normalize_result
 from phoenix_lib.utils.time import utc_timestamp
 
+if TYPE_CHECKING:
+    from langchain_core.prompts import PromptTemplate
+    from langchain_litellm import ChatLiteLLM
+else:
+    # LangChain and Langfuse are heavy imports; they are resolved on first use
+    # by the ``_*_cls()`` / ``_load_langfuse()`` helpers below and cached here.
+    PromptTemplate = None  # pylint: disable=invalid-name
+    ChatLiteLLM = None  # pylint: disable=invalid-name
+
+langfuse_module = None  # pylint: disable=invalid-name
+callback_handler_cls = None  # pylint: disable=invalid-name
+_langfuse_imported = False  # pylint: disable=invalid-name
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached per-request model overrides held by one LLMClient.
+_OVERRIDE_LLM_CACHE_SIZE = 32
+# Upper bound on cached ``prompt | llm`` chains held by one LLMClient.
+_CHAIN_CACHE_SIZE = 128
+
+
+def _prompt_template_cls():
+    """Return ``langchain_core.prompts.PromptTemplate``, importing it on first use."""
+    global PromptTemplate  # pylint: disable=global-statement
+    if PromptTemplate is None:
+        from langchain_core.prompts import \
+            PromptTemplate as _cls  # pylint: disable=import-outside-toplevel
+
+        PromptTemplate = _cls
+    return PromptTemplate
+
+
+def _chat_lite_llm_cls():
+    """Return ``langchain_litellm.ChatLiteLLM``, importing it on first use."""
+    global ChatLiteLLM  # pylint: disable=global-statement
+    if ChatLiteLLM is None:
+        from langchain_litellm import \
+            ChatLiteLLM as _cls  # pylint: disable=import-outside-toplevel
+
+        ChatLiteLLM = _cls
+    return ChatLiteLLM
+
+
+def _load_langfuse() -> None:
+    """Import the optional Langfuse SDK and its LangChain handler once.
+
+    Globals that are already set (e.g. patched by tests) are left untouched.
+    """
+    # pylint: disable=global-statement
+    global langfuse_module, callback_handler_cls, _langfuse_imported
+    if _langfuse_imported:
+        return
+    _langfuse_imported = True
+
+    if langfuse_module is None:
+        try:
+            import langfuse  # pylint: disable=import-outside-toplevel
+
+            langfuse_module = langfuse
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+    if callback_handler_cls is None:
+        try:
+            from langfuse.langchain import \
+                CallbackHandler  # pylint: disable=import-outside-toplevel
+
+            callback_handler_cls = CallbackHandler
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+
+def _request_id_for_log(context: Dict[str, Any]) -> Any:
+    """Return the caller's ``request_id``, or a timestamp when none was given."""
+    if "request_id" in context:
+        return context["request_id"]
+    return utc_timestamp()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_prompt(template_text: str) -> PromptTemplate:
+    """Build a jinja2 ``PromptTemplate``, memoised on the template text."""
+    return _prompt_template_cls().from_template(
+        template_text, template_format="jinja2"
+    )
+
+
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_renderer(template_text: str) -> Callable[[Dict[str, Any]], str]:
+    """Return a ``context -> str`` renderer for a jinja2 template text.
+
+    Templates without any Jinja markup render to the same string for every
+    context, so that string is computed once (through Jinja, to keep its
+    whitespace handling) and returned directly afterwards.
+    """
+    prompt = _compile_prompt(template_text)
+    if any(marker in template_text for marker in _JINJA_MARKERS):
+        return lambda context: prompt.format(**context)
+    rendered = prompt.format()
+    return lambda context: rendered
+
 
 class LLMClient:
     """Client for interacting with language models.
@@ -48,8 +139,13 @@ class LLMClient:
         self.prompt_loader = prompt_loader
         self._default_llm_config = default_llm_config
         self._llm: Optional[ChatLiteLLM] = None
+        self._override_llms: OrderedDict[Hashable, ChatLiteLLM] = OrderedDict()
+        self._chains: OrderedDict[Tuple[str, int], Any] = OrderedDict()
         self._langfuse = None
         self._langfuse_initialized = False
+        self._langfuse_handler = None
+        tracing_flag = str(os.getenv("LANGCHAIN_TRACING_V2", "")).strip().lower()
+        self._tracing_disabled = tracing_flag in {"false", "0", "no", "off"}
 
     @staticmethod
     def create_chat_model(llm_config: LLMConfig) -> Optional[ChatLiteLLM]:
@@ -68,7 +164,7 @@ class LLMClient:
             )
             return None
         try:
-            return ChatLiteLLM(
+            return _chat_lite_llm_cls()(
                 model=model_string,
                 model_kwargs=llm_config.params if llm_config.params else None,
                 callbacks=None,
@@ -79,7 +175,7 @@ class LLMClient:
 
     def _create_llm_from_config(self, llm_config: LLMConfig) -> ChatLiteLLM:
         """Create a ChatLiteLLM instance from an LLMConfig."""
-        return ChatLiteLLM(
+        return _chat_lite_llm_cls()(
             model=llm_config.model,
             model_kwargs=llm_config.params if llm_config.params else None,
             callbacks=None,
@@ -91,15 +187,55 @@ class LLMClient:
             self._llm = self._create_llm_from_config(self._default_llm_config)
         return self._llm
 
+    def _get_override_llm(self, model: Union[str, LLMConfig]) -> ChatLiteLLM:
+        """Return a cached LLM for a per-request model override (LRU-bounded)."""
+        if isinstance(model, LLMConfig):
+            key: Hashable = (model.model, repr(sorted(model.params.items())))
+        else:
+            key = model
+
+        llm = self._override_llms.get(key)
+        if llm is not None:
+            self._override_llms.move_to_end(key)
+            return llm
+
+        if isinstance(model, LLMConfig):
+            llm = self._create_llm_from_config(model)
+        else:
+            llm = _chat_lite_llm_cls()(model=model, callbacks=None)
+        self._override_llms[key] = llm
+        if len(self._override_llms) > _OVERRIDE_LLM_CACHE_SIZE:
+            self._override_llms.popitem(last=False)
+        return llm
+
+    def _get_chain(self, template_text: str, llm: ChatLiteLLM) -> Any:
+        """Return the cached ``prompt | llm`` runnable (LRU-bounded).
+
+        Keyed by template text, so an edited prompt file yields a new chain,
+        and by ``id(llm)``; the cached chain keeps ``llm`` alive, so the id
+        cannot be reused by another object while the entry exists.
+        """
+        key = (template_text, id(llm))
+        chain = self._chains.get(key)
+        if chain is not None:
+            self._chains.move_to_end(key)
+            return chain
+
+        chain = _compile_prompt(template_text) | llm
+        self._chains[key] = chain
+        if len(self._chains) > _CHAIN_CACHE_SIZE:
+            self._chains.popitem(last=False)
+        return chain
+
     def _get_langfuse_client(self):
         """Return Langfuse client lazily, honouring tracing-disabled environments."""
         if self._langfuse_initialized:
             return self._langfuse
 
         self._langfuse_initialized = True
-        tracing_flag = str(os.getenv("LANGCHAIN_TRACING_V2", "")).strip().lower()
-        if tracing_flag in {"false", "0", "no", "off"}:
+        if self._tracing_disabled:
             return None
+        _load_langfuse()
         if callback_handler_cls is None or langfuse_module is None:
             return None
 
@@ -115,6 +251,16 @@ class LLMClient:
 
         return self._langfuse
 
+    def _get_langfuse_handler(self):
+        """Return the Langfuse callback handler, creating it lazily if needed.
+
+        The handler tracks runs by ``run_id`` and attaches to the span that is
+        current at invocation time, so one instance serves every call.
+        """
+        if self._langfuse_handler is None:
+            self._langfuse_handler = callback_handler_cls()
+        return self._langfuse_handler
+
     @staticmethod
     def normalize_result(result: Any) -> str:
         """Convert LangChain/LiteLLM return values into a plain string."""
@@ -131,8 +277,7 @@ class LLMClient:
             Rendered prompt string.
         """
         template_text = self.prompt_loader.load(prompt_name)
-        prompt = PromptTemplate.from_template(template_text, template_format="jinja2")
-        return prompt.format(**context)
+        return _compile_renderer(template_text)(context)
 
     async def generate(
         self,
@@ -152,28 +297,25 @@ class LLMClient:
             Normalized string response.
         """
         template_text = self.prompt_loader.load(prompt_name)
-        prompt = PromptTemplate.from_template(template_text, template_format="jinja2")
 
         if model is not None:
-            if isinstance(model, LLMConfig):
-                llm_to_use = self._create_llm_from_config(model)
-            else:
-                llm_to_use = ChatLiteLLM(model=model, callbacks=None)
+            llm_to_use = self._get_override_llm(model)
         else:
             llm_to_use = self._get_default_llm()
 
-        chain = prompt | llm_to_use
+        chain = self._get_chain(template_text, llm_to_use)
 
-        logger.info(
-            "llm.generate prompt=%s request_id=%s",
-            prompt_name,
-            context.get("request_id", utc_timestamp()),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "llm.generate prompt=%s request_id=%s",
+                prompt_name,
+                _request_id_for_log(context),
+            )
 
         try:
             normalized = await self._invoke_with_tracing(chain, prompt_name, context)
         except Exception as e:
-            logger.error("llm.generate.error prompt=%s error=%s", prompt_name, str(e))
+            logger.error("llm.generate.error prompt=%s error=%s", prompt_name, e)
             raise
 
         return normalized
@@ -187,20 +329,20 @@ class LLMClient:
         (str/dict) rather than LangChain message objects.
         """
         template_text = self.prompt_loader.load(prompt_name)
-        prompt = PromptTemplate.from_template(template_text, template_format="jinja2")
-        chain = prompt | self._get_default_llm()
+        chain = self._get_chain(template_text, self._get_default_llm())
 
-        logger.info(
-            "llm.generate_structured prompt=%s request_id=%s",
-            prompt_name,
-            context.get("request_id", utc_timestamp()),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "llm.generate_structured prompt=%s request_id=%s",
+                prompt_name,
+                _request_id_for_log(context),
+            )
 
         try:
             normalized = await self._invoke_with_tracing(chain, prompt_name, context)
         except Exception as e:
             logger.error(
-                "llm.generate_structured.error prompt=%s error=%s", prompt_name, str(e)
+                "llm.generate_structured.error prompt=%s error=%s", prompt_name, e
             )
             raise
 
@@ -210,16 +352,20 @@ class LLMClient:
         self, chain, prompt_name: str, context: Dict[str, Any]
     ) -> str:
         """Invoke a LangChain chain with optional Langfuse tracing."""
-        langfuse_client = self._get_langfuse_client()
+        langfuse_client = (
+            self._langfuse
+            if self._langfuse_initialized
+            else self._get_langfuse_client()
+        )
 
         if langfuse_client:
             try:
                 with langfuse_client.start_as_current_span(  # pylint: disable=not-context-manager
                     name=prompt_name, input=context
                 ) as span:
-                    langfuse_handler = callback_handler_cls()
                     result = await chain.ainvoke(
-                        context, config={"callbacks": [langfuse_handler]}
+                        context,
+                        config={"callbacks": [self._get_langfuse_handler()]},
                     )
                     normalized = normalize_result(result)
                     try:
@@ -227,7 +373,7 @@ class LLMClient:
                     except Exception:  # pylint: disable=broad-exception-caught
                         logger.debug("langfuse.span.update.failed")
             except Exception as e:
-                logger.debug("langfuse.span.creation.failed: %s", str(e))
+                logger.debug("langfuse.span.creation.failed: %s", e)
                 result = await chain.ainvoke(context)
                 normalized = normalize_result(result)
 
@@ -1,8 +1,10 @@
 """YAML-based prompt loader shared across Phoenix services."""
 
+import os
 from pathlib import Path
+from typing import Iterable
 
-import yaml
+from phoenix_lib.config.yaml_loader import load_yaml_cached
 
 
 class PromptLoader:
@@ -15,10 +17,15 @@ class PromptLoader:
             base_dir: The base directory containing prompt template files.
         """
         self.base_dir = base_dir
+        # Resolved once so per-call path joins skip normalisation.
+        self._resolved_base_dir = Path(base_dir).resolve()
 
     def load(self, name: str) -> str:
         """Load a prompt template by name.
 
+        Parsed files are cached by ``(path, mtime, size)``; editing a prompt
+        file on disk invalidates its entry on the next call.
+
         Args:
             name: The name of the prompt template to load.
 
@@ -29,9 +36,27 @@ class PromptLoader:
             ValueError: If the template is missing or malformed.
             FileNotFoundError: If the prompt file does not exist.
         """
-        file_path = self.base_dir / f"{name}.yaml"
-        data = yaml.safe_load(file_path.read_text(encoding="utf-8"))
+        file_path = self._resolved_base_dir / f"{name}.yaml"
+        stat = os.stat(file_path)
+        data = load_yaml_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
         template = data.get("template")
         if not template:
             raise ValueError(f"Prompt '{name}' missing 'template' key in {file_path}")
         return template
+
+    def preload(self, names: Iterable[str]) -> None:
+        """Load and cache the given prompts ahead of the first request.
+
+        Call during service startup (after ``configure_logging``) so that the
+        first LLM call does not pay the YAML read and parse.
+
+        Raises:
+            ValueError: If a template is missing or malformed.
+            FileNotFoundError: If a prompt file does not exist.
+        """
+        for name in names:
+            self.load(name)
+
+    def preload_all(self) -> None:
+        """Load and cache every ``*.yaml`` prompt in ``base_dir``."""
+        self.preload(sorted(p.stem for p in self._resolved_base_dir.glob("*.yaml")))
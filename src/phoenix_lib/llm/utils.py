@@ -1,134 +1,262 @@
 """LLM output normalization utilities."""
 
 import json
-from typing import Any
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None  # pylint: disable=invalid-name
 
 from phoenix_lib.utils.text import strip_markdown_code_fences
 
 
-def normalize_result(result: Any) -> str:
-    """Convert LangChain/LiteLLM return values into a plain string.
+def _dumps(value: Any) -> str:
+    """Serialize to JSON, using orjson when it is installed.
 
-    Handles objects with .content, .choices, .message, .generations, dict payloads,
-    and plain strings. This ensures downstream code (and Pydantic) only sees
-    primitives.
+    orjson is an optional accelerator and writes compact output
+    (``{"k":"v"}``). Without it, and for values orjson rejects such as lone
+    surrogates, the stdlib keeps its default separators (``{"k": "v"}``).
     """
-    # pylint: disable=too-many-nested-blocks
-
-    def _extract_text(value: Any) -> str:
-        """Best-effort text extraction without serializing rich third-party models."""
-        if value is None:
-            return ""
-        if isinstance(value, str):
-            return value
-        if isinstance(value, (int, float, bool)):
-            return str(value)
-        if isinstance(value, dict):
-            if "content" in value:
-                return _extract_text(value["content"])
-            normalized = {str(k): _extract_text(v) for k, v in value.items()}
-            return json.dumps(normalized, ensure_ascii=False)
-        if isinstance(value, (list, tuple)):
-            parts = [_extract_text(v) for v in value]
-            return "\n".join(p for p in parts if p)
-        if hasattr(value, "content"):
-            try:
-                return _extract_text(value.content)
-            except Exception:  # pylint: disable=broad-exception-caught
-                return ""
-        if hasattr(value, "text"):
-            try:
-                return _extract_text(value.text)
-            except Exception:  # pylint: disable=broad-exception-caught
-                return ""
-        if hasattr(value, "model_dump"):
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, ensure_ascii=False)
+
+
+_MISSING = object()
+
+# Deepest nesting ``_extract_text`` follows; real LLM payloads stay far below.
+_MAX_DEPTH = 1000
+
+_TEXT = 0
+_SCALAR = 1
+_MAPPING = 2
+_SEQUENCE = 3
+
+# Exact-type dispatch for the shapes LLM payloads are made of; subclasses fall
+# back to the isinstance checks in ``_kind_of``.
+_KIND_BY_TYPE = {
+    str: _TEXT,
+    int: _SCALAR,
+    float: _SCALAR,
+    bool: _SCALAR,
+    dict: _MAPPING,
+    list: _SEQUENCE,
+    tuple: _SEQUENCE,
+}
+
+
+def _kind_of(value: Any) -> Optional[int]:
+    kind = _KIND_BY_TYPE.get(type(value))
+    if kind is not None:
+        return kind
+    if isinstance(value, str):
+        return _TEXT
+    if isinstance(value, (int, float, bool)):
+        return _SCALAR
+    if isinstance(value, dict):
+        return _MAPPING
+    if isinstance(value, (list, tuple)):
+        return _SEQUENCE
+    return None
+
+
+def _safe_getattr(value: Any, name: str) -> Any:
+    """Return ``value.<name>``, ``_MISSING`` if absent, or ``None`` if it raises."""
+    try:
+        return getattr(value, name, _MISSING)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+def _extract_text(
+    value: Any, _active: Optional[set] = None, _depth: int = 0
+) -> str:
+    """Best-effort text extraction without serializing rich third-party models.
+
+    Walks nested lists and ``.content``/``.text`` wrappers with an explicit
+    stack, collecting non-empty leaf strings and joining them once at the end.
+    A container or wrapper that is already being walked further up the same
+    branch is skipped, and branches nested deeper than ``_MAX_DEPTH`` are
+    dropped, so self-referential payloads and objects that fabricate
+    attributes on access (mocks) terminate instead of looping forever.
+    """
+    # pylint: disable=too-many-branches,too-many-statements
+    active = set() if _active is None else _active
+    parts = []
+    # Entries are ``(item, depth)``; ``(item, None)`` marks the end of
+    # ``item``'s branch and also keeps it alive so its id cannot be reused.
+    stack = [(value, _depth)]
+    while stack:
+        item, depth = stack.pop()
+        if depth is None:
+            active.discard(id(item))
+            continue
+        if item is None:
+            continue
+        kind = _kind_of(item)
+        if kind == _TEXT:
+            if item:
+                parts.append(item)
+            continue
+        if kind == _SCALAR:
+            parts.append(str(item))
+            continue
+        if depth >= _MAX_DEPTH or id(item) in active:
+            continue
+        active.add(id(item))
+        stack.append((item, None))
+        depth += 1
+        if kind == _MAPPING:
+            if "content" in item:
+                stack.append((item["content"], depth))
+            else:
+                normalized = {
+                    str(k): _extract_text(v, active, depth) for k, v in item.items()
+                }
+                parts.append(_dumps(normalized))
+            continue
+        if kind == _SEQUENCE:
+            stack.extend((child, depth) for child in reversed(item))
+            continue
+
+        content = _safe_getattr(item, "content")
+        if content is not _MISSING:
+            stack.append((content, depth))
+            continue
+        text = _safe_getattr(item, "text")
+        if text is not _MISSING:
+            stack.append((text, depth))
+            continue
+        if hasattr(item, "model_dump"):
             try:
-                dumped = value.model_dump(
-                    mode="json", exclude_none=True, warnings=False
-                )
+                dumped = item.model_dump(mode="json", exclude_none=True, warnings=False)
             except TypeError:
-                dumped = value.model_dump(mode="json", exclude_none=True)
+                dumped = item.model_dump(mode="json", exclude_none=True)
             except Exception:  # pylint: disable=broad-exception-caught
                 dumped = None
             if dumped is not None:
-                return _extract_text(dumped)
-        try:
-            return repr(value)
-        except Exception:  # pylint: disable=broad-exception-caught
-            return ""
-
-    output = ""
-
-    if result is None:
-        pass
-    elif isinstance(result, str):
-        output = result
-    elif hasattr(result, "content"):
-        output = _extract_text(result.content)
-    elif hasattr(result, "choices"):
-        choices = result.choices
+                stack.append((dumped, depth))
+                continue
         try:
-            if isinstance(choices, (list, tuple)):
-                texts = []
-                for c in choices:
-                    if hasattr(c, "message"):
-                        texts.append(_extract_text(c.message))
-                    elif hasattr(c, "text"):
-                        texts.append(_extract_text(c.text))
-                    else:
-                        texts.append(_extract_text(c))
-                output = "\n".join(t for t in texts if t)
-            else:
-                output = _extract_text(choices)
+            parts.append(repr(item))
         except Exception:  # pylint: disable=broad-exception-caught
-            output = _extract_text(result)
-    elif isinstance(result, dict):
-        if "choices" in result and isinstance(result["choices"], (list, tuple)):
+            pass
+    return "\n".join(parts)
+
+
+def _normalize_choices(result: Any) -> str:
+    choices = result.choices
+    try:
+        if isinstance(choices, (list, tuple)):
             texts = []
-            for item in result["choices"]:
-                if isinstance(item, dict):
-                    if "message" in item:
-                        texts.append(_extract_text(item["message"]))
-                    elif "text" in item:
-                        texts.append(_extract_text(item["text"]))
-                    else:
-                        texts.append(_extract_text(item))
-                elif hasattr(item, "message"):
-                    texts.append(_extract_text(item.message))
+            for c in choices:
+                if hasattr(c, "message"):
+                    texts.append(_extract_text(c.message))
+                elif hasattr(c, "text"):
+                    texts.append(_extract_text(c.text))
                 else:
-                    texts.append(_extract_text(item))
-            output = "\n".join(t for t in texts if t)
-        elif "message" in result:
-            output = _extract_text(result["message"])
-        else:
-            output = _extract_text(result)
-    elif hasattr(result, "generations"):
-        gens = result.generations
-        try:
-            texts = []
-            for g in gens:
-                if isinstance(g, (list, tuple)):
-                    for e in g:
-                        if hasattr(e, "text"):
-                            texts.append(_extract_text(e.text))
-                        elif hasattr(e, "content"):
-                            texts.append(_extract_text(e.content))
-                        else:
-                            texts.append(_extract_text(e))
+                    texts.append(_extract_text(c))
+            return "\n".join(t for t in texts if t)
+        return _extract_text(choices)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return _extract_text(result)
+
+
+def _normalize_dict(result: dict) -> str:
+    if "choices" in result and isinstance(result["choices"], (list, tuple)):
+        texts = []
+        for item in result["choices"]:
+            if isinstance(item, dict):
+                if "message" in item:
+                    texts.append(_extract_text(item["message"]))
+                elif "text" in item:
+                    texts.append(_extract_text(item["text"]))
                 else:
-                    if hasattr(g, "text"):
-                        texts.append(_extract_text(g.text))
-                    elif hasattr(g, "content"):
-                        texts.append(_extract_text(g.content))
+                    texts.append(_extract_text(item))
+            elif hasattr(item, "message"):
+                texts.append(_extract_text(item.message))
+            else:
+                texts.append(_extract_text(item))
+        return "\n".join(t for t in texts if t)
+    if "message" in result:
+        return _extract_text(result["message"])
+    return _extract_text(result)
+
+
+def _normalize_generations(result: Any) -> str:
+    gens = result.generations
+    try:
+        texts = []
+        for g in gens:
+            if isinstance(g, (list, tuple)):
+                for e in g:
+                    if hasattr(e, "text"):
+                        texts.append(_extract_text(e.text))
+                    elif hasattr(e, "content"):
+                        texts.append(_extract_text(e.content))
                     else:
-                        texts.append(_extract_text(g))
-            output = "\n".join(t for t in texts if t)
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
+                        texts.append(_extract_text(e))
+            else:
+                if hasattr(g, "text"):
+                    texts.append(_extract_text(g.text))
+                elif hasattr(g, "content"):
+                    texts.append(_extract_text(g.content))
+                else:
+                    texts.append(_extract_text(g))
+        return "\n".join(t for t in texts if t)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return ""
+
+
+def _decode_bytes(result: Any) -> str:
+    return result.decode("utf-8", "replace")
+
+
+# Exact built-in types dispatch without attribute probing. Anything else goes
+# through the attribute cascade in ``normalize_result``: which attributes an
+# object has can vary per instance, so handlers are not memoised by type.
+_RESULT_HANDLERS: Dict[type, Callable[[Any], str]] = {
+    str: lambda text: text,
+    bytes: _decode_bytes,
+    bytearray: _decode_bytes,
+    dict: _normalize_dict,
+    type(None): lambda _: "",
+}
+
+
+def normalize_result(result: Any) -> str:
+    """Convert LangChain/LiteLLM return values into a plain string.
+
+    Handles objects with .content, .choices, .message, .generations, dict payloads,
+    bytes, and plain strings. This ensures downstream code (and Pydantic) only
+    sees primitives.
+    """
+    handler = _RESULT_HANDLERS.get(type(result))
+    if handler is not None:
+        output = handler(result)
     else:
-        output = _extract_text(result)
+        content = getattr(result, "content", None)
+        if isinstance(content, str):
+            # Fast path: AIMessage-like results whose content is already a string.
+            output = content
+        elif isinstance(result, str):
+            output = result
+        elif isinstance(result, (bytes, bytearray)):
+            output = _decode_bytes(result)
+        elif hasattr(result, "content"):
+            output = _extract_text(result.content)
+        elif hasattr(result, "choices"):
+            output = _normalize_choices(result)
+        elif isinstance(result, dict):
+            output = _normalize_dict(result)
+        elif hasattr(result, "generations"):
+            output = _normalize_generations(result)
+        else:
+            output = _extract_text(result)
 
     # Strip markdown code fences if the entire output is wrapped in them
-    output = strip_markdown_code_fences(output)
-
-    return output
+    return strip_markdown_code_fences(output)
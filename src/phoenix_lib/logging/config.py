@@ -1,36 +1,86 @@
 """Structured logging configuration shared across Phoenix services."""
 
+import functools
 import logging
 import sys
+import threading
+from typing import Optional
+
+# Resolved once by ``_detect_structlog()``: whether structlog is importable,
+# and the module itself when it is.
+_USE_STRUCTLOG: Optional[bool] = None
+_structlog = None
+
+# Level applied by the last ``configure_logging()`` call; repeat calls with
+# the same level are no-ops.
+_CONFIGURED_LEVEL: Optional[int] = None
+_CONFIGURE_LOCK = threading.Lock()
+
+
+def _detect_structlog() -> bool:
+    """Import structlog on first call and remember whether it is available."""
+    global _USE_STRUCTLOG, _structlog  # pylint: disable=global-statement
+    if _USE_STRUCTLOG is None:
+        try:
+            import structlog  # pylint: disable=import-outside-toplevel
+        except Exception:  # pylint: disable=broad-exception-caught
+            _USE_STRUCTLOG = False
+        else:
+            _structlog = structlog
+            _USE_STRUCTLOG = True
+    return _USE_STRUCTLOG
+
+
+class _StdlibAdapter(logging.LoggerAdapter):
+    """LoggerAdapter that accepts structlog-style keyword arguments."""
+
+    def process(self, msg, kwargs):
+        extra = kwargs.pop("extra", {}) or {}
+        for k in list(kwargs.keys()):
+            if k not in ("exc_info", "stack_info", "stacklevel"):
+                extra[k] = kwargs.pop(k)
+        kwargs["extra"] = extra
+        return msg, kwargs
 
 
 def configure_logging(log_level: str = "INFO") -> None:
     """Configure structured logging using structlog (with stdlib fallback).
 
     Call this once at application startup, before any loggers are created.
+    Calling it again with the level already in effect does nothing.
 
     Args:
         log_level: Log level string (e.g. "INFO", "DEBUG"). Defaults to "INFO".
     """
+    global _CONFIGURED_LEVEL  # pylint: disable=global-statement
     level_int = getattr(logging, log_level.upper(), logging.INFO)
 
-    try:
-        import structlog  # pylint: disable=import-outside-toplevel
-    except Exception:  # pylint: disable=broad-exception-caught
+    with _CONFIGURE_LOCK:
+        if _CONFIGURED_LEVEL == level_int:
+            return
+        _apply_logging_config(level_int)
+        _CONFIGURED_LEVEL = level_int
+
+
+def _apply_logging_config(level_int: int) -> None:
+    # Proxies created under the previous configuration bind it on first use;
+    # drop them so later ``get_logger()`` calls see the new level.
+    _cached_logger.cache_clear()
+    if not _detect_structlog():
         # Fallback: plain stdlib logging when structlog is unavailable
         logging.basicConfig(format="%(message)s", stream=sys.stdout, level=level_int)
         return
 
-    structlog.configure(
+    _structlog.configure(
         processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            _structlog.contextvars.merge_contextvars,
+            _structlog.processors.TimeStamper(fmt="iso"),
+            _structlog.processors.add_log_level,
+            _structlog.processors.StackInfoRenderer(),
+            _structlog.processors.format_exc_info,
+            _structlog.processors.JSONRenderer(),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(level_int),
+        wrapper_class=_structlog.make_filtering_bound_logger(level_int),
         cache_logger_on_first_use=True,
     )
 
@@ -53,20 +103,14 @@ def get_logger(name: str):
     Returns:
         structlog bound logger or a stdlib LoggerAdapter.
     """
-    try:
-        import structlog  # pylint: disable=import-outside-toplevel
-
-        return structlog.get_logger(name)
-    except Exception:  # pylint: disable=broad-exception-caught
-        base = logging.getLogger(name)
-
-        class _StdlibAdapter(logging.LoggerAdapter):
-            def process(self, msg, kwargs):
-                extra = kwargs.pop("extra", {}) or {}
-                for k in list(kwargs.keys()):
-                    if k not in ("exc_info", "stack_info", "stacklevel"):
-                        extra[k] = kwargs.pop(k)
-                kwargs["extra"] = extra
-                return msg, kwargs
-
-        return _StdlibAdapter(base, {})
+    return _cached_logger(name, _detect_structlog())
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_logger(name: str, use_structlog: bool):
+    # structlog's lazy proxy resolves its configuration on first use, so
+    # caching it is safe even when loggers are created before
+    # ``configure_logging()`` runs. Reconfiguring clears this cache.
+    if use_structlog:
+        return _structlog.get_logger(name)
+    return _StdlibAdapter(logging.getLogger(name), {})
@@ -6,14 +6,28 @@ Provides parser helpers mirroring domain/json_resume.py.
 
 from __future__ import annotations
 
+import functools
 from enum import Enum
+from typing import Literal
 
-from pydantic import AnyUrl, BaseModel, ConfigDict, Field, RootModel, constr
+from pydantic import (AnyUrl, BaseModel, ConfigDict, Field, RootModel,
+                      StringConstraints)
+from typing_extensions import Annotated
 
+_ISO8601_PATTERN = r"^([1-2][0-9]{3}-[0-1][0-9]-[0-3][0-9]|[1-2][0-9]{3}-[0-1][0-9]|[1-2][0-9]{3})$"
+
+# Shared by the RootModel type argument and its ``root`` field so the pattern
+# is declared (and compiled) once.
+_Iso8601Str = Annotated[str, StringConstraints(pattern=_ISO8601_PATTERN)]
+
+
+class _OpenModel(BaseModel):
+    """Base for job schema models, which keep unknown keys."""
 
-class Location(BaseModel):
     model_config = ConfigDict(extra="allow")
 
+
+class Location(_OpenModel):
     address: str | None = Field(
         None,
         description="To add multiple address lines, use \\n. For example, 1234 Glücklichkeit Straße\\nHinterhaus 5. Etage li.",
@@ -29,15 +43,18 @@ class Location(BaseModel):
     )
 
 
-class Remote(Enum):
+RemoteLevel = Literal["Full", "Hybrid", "None"]
+
+
+class Remote(str, Enum):
+    """Named constants for ``RemoteLevel``; members compare equal to the strings."""
+
     Full = "Full"
     Hybrid = "Hybrid"
     None_ = "None"
 
 
-class Skill(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class Skill(_OpenModel):
     name: str | None = Field(None, description="e.g. Web Development")
     level: str | None = Field(None, description="e.g. Master")
     keywords: list[str] | None = Field(
@@ -45,9 +62,7 @@ class Skill(BaseModel):
     )
 
 
-class Meta(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class Meta(_OpenModel):
     canonical: AnyUrl | None = Field(
         None, description="URL (as per RFC 3986) to latest version of this document"
     )
@@ -59,24 +74,14 @@ class Meta(BaseModel):
     )
 
 
-class Iso8601(
-    RootModel[
-        constr(
-            pattern=r"^([1-2][0-9]{3}-[0-1][0-9]-[0-3][0-9]|[1-2][0-9]{3}-[0-1][0-9]|[1-2][0-9]{3})$"
-        )
-    ]
-):
-    root: constr(
-        pattern=r"^([1-2][0-9]{3}-[0-1][0-9]-[0-3][0-9]|[1-2][0-9]{3}-[0-1][0-9]|[1-2][0-9]{3})$"
-    ) = Field(
+class Iso8601(RootModel[_Iso8601Str]):
+    root: _Iso8601Str = Field(
         ...,
         description="Similar to the standard date type, but each section after the year is optional. e.g. 2014-06-29 or 2023-04",
     )
 
 
-class JobDescriptionSchema(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
+class JobDescriptionSchema(_OpenModel):
     title: str | None = Field(None, description="e.g. Web Developer")
     company: str | None = Field(None, description="Microsoft")
     type: str | None = Field(None, description="Full-time, part-time, contract, etc.")
@@ -85,7 +90,7 @@ class JobDescriptionSchema(BaseModel):
         None, description="Write a short description about the job"
     )
     location: Location | None = None
-    remote: Remote | None = Field(
+    remote: RemoteLevel | None = Field(
         None, description="the level of remote work available"
     )
     salary: str | None = Field(None, description="100000")
@@ -103,14 +108,19 @@ class JobDescriptionSchema(BaseModel):
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_job_schema_parser():
-    """Return a LangChain PydanticOutputParser for JobDescriptionSchema."""
+    """Return a LangChain PydanticOutputParser for JobDescriptionSchema.
+
+    The parser is built once and shared; the schema it wraps is fixed.
+    """
     from langchain_core.output_parsers import \
         PydanticOutputParser  # pylint: disable=import-outside-toplevel
 
     return PydanticOutputParser(pydantic_object=JobDescriptionSchema)
 
 
+@functools.lru_cache(maxsize=None)
 def get_job_schema_format_instructions() -> str:
     """Return LLM format instructions for generating a valid JobDescriptionSchema."""
     return get_job_schema_parser().get_format_instructions()
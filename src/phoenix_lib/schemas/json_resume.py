@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from pydantic import (AnyUrl, BaseModel, ConfigDict, EmailStr, Field,
                       RootModel, StringConstraints)
 from typing_extensions import Annotated
@@ -301,14 +303,19 @@ Work = WorkItem
 Volunteer = VolunteerItem
 
 
+@functools.lru_cache(maxsize=None)
 def get_json_resume_parser():
-    """Return a LangChain PydanticOutputParser for JSON Resume format."""
+    """Return a LangChain PydanticOutputParser for JSON Resume format.
+
+    The parser is built once and shared; the schema it wraps is fixed.
+    """
     from langchain_core.output_parsers import \
         PydanticOutputParser  # pylint: disable=import-outside-toplevel
 
     return PydanticOutputParser(pydantic_object=ResumeSchema)
 
 
+@functools.lru_cache(maxsize=None)
 def get_json_resume_format_instructions() -> str:
     """Return LLM format instructions for generating a valid JSON Resume."""
     return get_json_resume_parser().get_format_instructions()
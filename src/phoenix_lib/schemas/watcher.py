@@ -6,35 +6,53 @@ silent schema drift between independently maintained copies.
 
 from __future__ import annotations
 
+import functools
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Self, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: type) -> TypeAdapter:
+    """Return a shared ``TypeAdapter(List[model])``; building one is costly."""
+    return TypeAdapter(List[model])
+
+
+def _wrap_keywords(value: Any) -> Any:
+    """Accept a bare keyword string as a one-element list."""
+    return [value] if isinstance(value, str) else value
 
 
 class JobAlertCreate(BaseModel):
     """Request payload for creating a new job alert."""
 
     alert_name: Optional[str] = None
-    keywords: Union[str, List[str]]
+    keywords: List[str]
     sources: Optional[List[str]] = None
     location: Optional[str] = None
     check_interval_minutes: int = 5
     filters: Optional[Dict[str, Any]] = None
 
+    _normalize_keywords = field_validator("keywords", mode="before")(_wrap_keywords)
+
 
 class JobAlertUpdate(BaseModel):
     """Request payload for updating an existing job alert."""
 
     alert_name: Optional[str] = None
-    keywords: Optional[Union[str, List[str]]] = None
+    keywords: Optional[List[str]] = None
     sources: Optional[List[str]] = None
     location: Optional[str] = None
     check_interval_minutes: Optional[int] = None
     filters: Optional[Dict[str, Any]] = None
     is_active: Optional[bool] = None
 
+    _normalize_keywords = field_validator("keywords", mode="before")(_wrap_keywords)
+
 
 class LinkedInCookieCreate(BaseModel):
     """Request payload for creating or updating LinkedIn session cookies."""
@@ -44,11 +62,53 @@ class LinkedInCookieCreate(BaseModel):
     additional_cookies: Optional[Dict[str, str]] = None
 
 
-class JobListingResponse(BaseModel):
+class _ResponseModel(BaseModel):
+    """Base for immutable response DTOs built from database rows."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+    @classmethod
+    def from_row(cls, row: Any) -> Self:
+        """Build an instance from a trusted ORM row, skipping validation.
+
+        Only use this for rows read from our own database; anything that
+        crossed a trust boundary must go through ``model_validate``. Nested
+        response models are built from the row's related objects the same way.
+
+        Raises:
+            AttributeError: If the row lacks a required field.
+        """
+        values = {}
+        for name, field in cls.model_fields.items():
+            if field.is_required():
+                value = getattr(row, name)
+            else:
+                value = getattr(row, name, _MISSING)
+                if value is _MISSING:
+                    continue
+            annotation = field.annotation
+            if (
+                value is not None
+                and isinstance(annotation, type)
+                and issubclass(annotation, _ResponseModel)
+            ):
+                value = annotation.from_row(value)
+            values[name] = value
+        return cls.model_construct(**values)
+
+    @classmethod
+    def list_from_json(cls, data: Union[str, bytes, bytearray]) -> List[Self]:
+        """Validate a JSON array of records in one pass.
+
+        The payload is parsed and validated by pydantic-core directly, without
+        materialising intermediate Python dicts.
+        """
+        return _list_adapter(cls).validate_json(data)
+
+
+class JobListingResponse(_ResponseModel):
     """Response schema for a scraped job listing."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: uuid.UUID
     external_id: str
     source: str
@@ -72,11 +132,9 @@ class JobListingResponse(BaseModel):
     created_at: datetime
 
 
-class JobMatchResponse(BaseModel):
+class JobMatchResponse(_ResponseModel):
     """Response schema for a job match record."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     id: uuid.UUID
     job_alert_id: uuid.UUID
     job_listing_id: uuid.UUID
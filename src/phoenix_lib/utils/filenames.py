@@ -7,13 +7,17 @@ import re
 import unicodedata
 
 _UNICODE_DASHES_RE = re.compile(r"[‐‑‒–—―−]+")
-_SEPARATORS_RE = re.compile(r"[\s_]+")
-_INVALID_BASE_CHAR_RE = re.compile(r"[^A-Za-z0-9.-]+")
+# Separators, dashes and unsupported characters all collapse to a single dash.
+_BASE_DASH_RUN_RE = re.compile(r"[^A-Za-z0-9.]+")
 _INVALID_EXT_CHAR_RE = re.compile(r"[^A-Za-z0-9]+")
-_MULTI_DASH_RE = re.compile(r"-+")
 
 
 def _ascii_normalize(value: str) -> str:
+    # ASCII input is already NFKD-normal and contains no unicode dashes.
+    if value.isascii():
+        return value
+    # A precomputed str.translate fold table was measured here and only wins
+    # on inputs of a few characters; NFKD in C scales better with length.
     value = _UNICODE_DASHES_RE.sub("-", value)
     normalized = unicodedata.normalize("NFKD", value)
     return normalized.encode("ascii", "ignore").decode("ascii")
@@ -22,10 +26,7 @@ def _ascii_normalize(value: str) -> str:
 def sanitize_filename_component(value: str, fallback: str = "file") -> str:
     """Sanitize a single filename component using dash-separated words."""
     normalized = _ascii_normalize(value or "")
-    normalized = _SEPARATORS_RE.sub("-", normalized)
-    normalized = _INVALID_BASE_CHAR_RE.sub("-", normalized)
-    normalized = _MULTI_DASH_RE.sub("-", normalized)
-    normalized = normalized.strip("-.")
+    normalized = _BASE_DASH_RUN_RE.sub("-", normalized).strip("-.")
     return normalized or fallback
 
 
@@ -42,8 +43,11 @@ def sanitize_filename(filename: str, fallback: str = "download") -> str:
     base, ext = os.path.splitext(raw)
 
     safe_base = sanitize_filename_component(base or raw, fallback=fallback)
-    safe_ext = _ascii_normalize(ext)
-    safe_ext = _INVALID_EXT_CHAR_RE.sub("", safe_ext.lstrip("."))
+    if not ext:
+        return safe_base
+    # The dot itself is not in the allowed class, so one substitution drops it
+    # along with any other unsupported characters.
+    safe_ext = _INVALID_EXT_CHAR_RE.sub("", _ascii_normalize(ext))
 
     if safe_ext:
         return f"{safe_base}.{safe_ext.lower()}"
@@ -2,6 +2,11 @@
 
 import re
 
+# Opening fence with optional language identifier, content, closing fence.
+# Greedy ``.+`` is deliberate: with the ``$`` anchor it jumps to the end and
+# backtracks a few characters, where a lazy ``.+?`` retries at every position.
+_FENCE_RE = re.compile(r"^```[a-zA-Z0-9_-]*\n(.+)\n?```$", re.DOTALL)
+
 
 def strip_markdown_code_fences(text: str) -> str:
     """Strip markdown code fences from text if the entire content is wrapped in them.
@@ -21,16 +26,8 @@ def strip_markdown_code_fences(text: str) -> str:
     if not stripped.startswith("```"):
         return text
 
-    # Match ``` with optional language identifier at start, content, and ``` at end
-    pattern = r"^```[a-zA-Z0-9_-]*\n(.+)\n?```$"
-    match = re.match(pattern, stripped, re.DOTALL)
+    match = _FENCE_RE.match(stripped)
     if match:
         return match.group(1).strip()
 
-    # Also try without language identifier but with newline
-    pattern_no_lang = r"^```\n(.+)\n?```$"
-    match_no_lang = re.match(pattern_no_lang, stripped, re.DOTALL)
-    if match_no_lang:
-        return match_no_lang.group(1).strip()
-
     return text
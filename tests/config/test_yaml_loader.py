@@ -1,5 +1,8 @@
 """Tests for phoenix_lib.config.yaml_loader."""
 
+import stat
+
+from phoenix_lib.config import yaml_loader
 from phoenix_lib.config.yaml_loader import (CONFIG_FILE_ENV_VAR,
                                             load_yaml_config)
 
@@ -73,3 +76,107 @@ class TestLoadYamlConfig:
         cfg_file.write_text("x: 1", encoding="utf-8")
         result = load_yaml_config(local_path=cfg_file)
         assert isinstance(result, dict)
+
+    def test_unchanged_file_parsed_once(self, tmp_path, mocker):
+        cfg_file = tmp_path / "cached.yaml"
+        cfg_file.write_text("x: 1", encoding="utf-8")
+        spy = mocker.spy(yaml_loader.yaml, "load")
+        load_yaml_config(local_path=cfg_file)
+        load_yaml_config(local_path=cfg_file)
+        assert spy.call_count == 1
+
+    def test_modified_file_reparsed(self, tmp_path):
+        cfg_file = tmp_path / "reload.yaml"
+        cfg_file.write_text("x: 1", encoding="utf-8")
+        assert load_yaml_config(local_path=cfg_file)["x"] == 1
+        cfg_file.write_text("x: 22", encoding="utf-8")
+        assert load_yaml_config(local_path=cfg_file)["x"] == 22
+
+    def test_mutating_result_does_not_affect_cache(self, tmp_path):
+        cfg_file = tmp_path / "mutable.yaml"
+        cfg_file.write_text("outer:\n  inner: deep", encoding="utf-8")
+        first = load_yaml_config(local_path=cfg_file)
+        first["outer"]["inner"] = "changed"
+        assert load_yaml_config(local_path=cfg_file)["outer"]["inner"] == "deep"
+
+    def test_no_json_sidecar_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(yaml_loader.JSON_SIDECAR_ENV_VAR, raising=False)
+        cfg_file = tmp_path / "plain.yaml"
+        cfg_file.write_text("key: value", encoding="utf-8")
+        load_yaml_config(local_path=cfg_file)
+        assert list(tmp_path.iterdir()) == [cfg_file]
+
+    def test_writes_json_sidecar(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(yaml_loader.JSON_SIDECAR_ENV_VAR, "1")
+        cfg_file = tmp_path / "sidecar.yaml"
+        cfg_file.write_text("key: value", encoding="utf-8")
+        load_yaml_config(local_path=cfg_file)
+        assert (tmp_path / "sidecar.yaml.json").exists()
+
+    def test_sidecar_keeps_source_permissions(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(yaml_loader.JSON_SIDECAR_ENV_VAR, "1")
+        cfg_file = tmp_path / "secret.yaml"
+        cfg_file.write_text("db_password: hunter2", encoding="utf-8")
+        cfg_file.chmod(0o600)
+        load_yaml_config(local_path=cfg_file)
+        sidecar_mode = (tmp_path / "secret.yaml.json").stat().st_mode
+        assert stat.S_IMODE(sidecar_mode) == 0o600
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "secret.yaml",
+            "secret.yaml.json",
+        ]
+
+    def test_fresh_sidecar_skips_yaml_parse(self, tmp_path, mocker, monkeypatch):
+        monkeypatch.setenv(yaml_loader.JSON_SIDECAR_ENV_VAR, "1")
+        cfg_file = tmp_path / "warm.yaml"
+        cfg_file.write_text("key: value", encoding="utf-8")
+        load_yaml_config(local_path=cfg_file)
+        yaml_loader.clear_config_cache()
+        spy = mocker.spy(yaml_loader.yaml, "load")
+        assert load_yaml_config(local_path=cfg_file) == {"key": "value"}
+        assert spy.call_count == 0
+
+    def test_stale_sidecar_ignored(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(yaml_loader.JSON_SIDECAR_ENV_VAR, "1")
+        cfg_file = tmp_path / "stale.yaml"
+        cfg_file.write_text("key: old", encoding="utf-8")
+        load_yaml_config(local_path=cfg_file)
+        yaml_loader.clear_config_cache()
+        cfg_file.write_text("key: newer", encoding="utf-8")
+        assert load_yaml_config(local_path=cfg_file)["key"] == "newer"
+
+    def test_clear_config_cache_forces_reload(self, tmp_path, mocker):
+        cfg_file = tmp_path / "cleared.yaml"
+        cfg_file.write_text("1: 2024-01-01", encoding="utf-8")
+        load_yaml_config(local_path=cfg_file)
+        yaml_loader.clear_config_cache()
+        spy = mocker.spy(yaml_loader.yaml, "load")
+        load_yaml_config(local_path=cfg_file)
+        assert spy.call_count == 1
+
+    def test_non_json_data_has_no_sidecar(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(yaml_loader.JSON_SIDECAR_ENV_VAR, "1")
+        cfg_file = tmp_path / "dates.yaml"
+        cfg_file.write_text("1: 2024-01-01", encoding="utf-8")
+        result = load_yaml_config(local_path=cfg_file)
+        assert 1 in result
+        assert not (tmp_path / "dates.yaml.json").exists()
+
+    def test_directory_docker_path_falls_through_to_local(self, tmp_path):
+        local_file = tmp_path / "local.yaml"
+        local_file.write_text("source: local", encoding="utf-8")
+        result = load_yaml_config(local_path=local_file, docker_path=tmp_path)
+        assert result["source"] == "local"
+
+    def test_symlink_loop_falls_through_to_local(self, tmp_path):
+        loop = tmp_path / "loop.yaml"
+        loop.symlink_to(loop)
+        local_file = tmp_path / "local.yaml"
+        local_file.write_text("source: local", encoding="utf-8")
+        result = load_yaml_config(local_path=local_file, docker_path=loop)
+        assert result["source"] == "local"
+
+    def test_utf8_values_decoded(self, tmp_path):
+        cfg_file = tmp_path / "unicode.yaml"
+        cfg_file.write_text("greeting: Grüße", encoding="utf-8")
+        assert load_yaml_config(local_path=cfg_file)["greeting"] == "Grüße"
@@ -1,7 +1,13 @@
 """Shared pytest fixtures and configuration for phoenix_lib test suite."""
 
+import os
+
 import pytest
 
+# Tests must not reach the network: stop litellm fetching its model cost map
+# at import time and use the copy bundled with the package.
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
 
 @pytest.fixture
 def tmp_yaml(tmp_path):
@@ -3,6 +3,8 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import literal, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from phoenix_lib.db.unit_of_work import BaseUnitOfWork
 
@@ -43,6 +45,9 @@ class TestBaseUnitOfWorkInit:
         assert uow._session is None
         assert uow._owns_session is False
 
+    def test_base_state_is_slotted(self):
+        assert not hasattr(BaseUnitOfWork(), "__dict__")
+
 
 class TestSessionProperty:
     def test_uses_injected_session(self):
@@ -178,3 +183,48 @@ class TestContextManager:
         uow = ConcreteUoW(session=mock_session)
         async with uow as ctx:
             assert ctx is uow
+
+
+class TestRealSession:
+    @pytest.fixture
+    async def session_factory(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE items (name TEXT)"))
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    async def _names(self, session_factory):
+        async with session_factory() as session:
+            return (await session.execute(text("SELECT name FROM items"))).all()
+
+    async def test_write_via_execute_commits(self, session_factory):
+        async with ConcreteUoW(factory=session_factory) as uow:
+            await uow.session.execute(text("INSERT INTO items VALUES ('a')"))
+        assert await self._names(session_factory) == [("a",)]
+
+    async def test_read_only_exit_commits_callers_pending_write(
+        self, session_factory
+    ):
+        session = session_factory()
+        await session.execute(text("INSERT INTO items VALUES ('c')"))
+        async with ConcreteUoW(session=session) as uow:
+            await uow.session.execute(select(literal(1)))
+        assert not session.in_transaction()
+        assert await self._names(session_factory) == [("c",)]
+        await session.close()
+
+    async def test_slotted_subclass_commits(self, session_factory):
+        class SlottedUoW(BaseUnitOfWork):
+            __slots__ = ("_factory",)
+
+            def __init__(self, factory):
+                super().__init__()
+                self._factory = factory
+
+            def _create_session(self):
+                return self._factory()
+
+        async with SlottedUoW(session_factory) as uow:
+            await uow.session.execute(text("INSERT INTO items VALUES ('b')"))
+        assert await self._names(session_factory) == [("b",)]
@@ -0,0 +1,173 @@
+"""Tests for phoenix_lib.llm.client."""
+
+import subprocess
+import sys
+
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableLambda
+
+from phoenix_lib.llm.client import (LLMClient, _chat_lite_llm_cls,
+                                     _compile_prompt, _compile_renderer)
+from phoenix_lib.llm.config import LLMConfig
+from phoenix_lib.llm.prompts import PromptLoader
+
+
+def _make_client(tmp_path):
+    (tmp_path / "greet.yaml").write_text(
+        "template: Hello, {{ name }}!", encoding="utf-8"
+    )
+    return LLMClient(PromptLoader(tmp_path), LLMConfig())
+
+
+class TestLazyImports:
+    def test_import_does_not_load_langchain_or_langfuse(self):
+        code = (
+            "import sys, phoenix_lib.llm.client; "
+            "print(any(m in sys.modules for m in "
+            "('langchain_core', 'langchain_litellm', 'langfuse')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_chat_lite_llm_resolved_on_first_use(self):
+        from langchain_litellm import ChatLiteLLM
+
+        assert _chat_lite_llm_cls() is ChatLiteLLM
+
+
+class TestCompilePrompt:
+    def test_same_text_returns_cached_template(self):
+        assert _compile_prompt("Hi {{ x }}") is _compile_prompt("Hi {{ x }}")
+
+    def test_different_text_returns_different_template(self):
+        assert _compile_prompt("A {{ x }}") is not _compile_prompt("B {{ x }}")
+
+
+class TestRenderPrompt:
+    def test_renders_template(self, tmp_path):
+        client = _make_client(tmp_path)
+        assert client.render_prompt("greet", {"name": "Ada"}) == "Hello, Ada!"
+
+    def test_repeated_renders_use_fresh_context(self, tmp_path):
+        client = _make_client(tmp_path)
+        assert client.render_prompt("greet", {"name": "Ada"}) == "Hello, Ada!"
+        assert client.render_prompt("greet", {"name": "Bob"}) == "Hello, Bob!"
+
+
+class TestLangfuseHandler:
+    def test_handler_created_once(self, tmp_path, mocker):
+        handler_cls = mocker.patch("phoenix_lib.llm.client.callback_handler_cls")
+        client = _make_client(tmp_path)
+        first = client._get_langfuse_handler()
+        second = client._get_langfuse_handler()
+        assert first is second
+        handler_cls.assert_called_once_with()
+
+
+class TestLangfuseClient:
+    def test_tracing_disabled_by_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LANGCHAIN_TRACING_V2", "false")
+        client = _make_client(tmp_path)
+        assert client._tracing_disabled is True
+        assert client._get_langfuse_client() is None
+
+    def test_patched_langfuse_globals_survive_first_use(
+        self, tmp_path, monkeypatch, mocker
+    ):
+        monkeypatch.delenv("LANGCHAIN_TRACING_V2", raising=False)
+        monkeypatch.setattr("phoenix_lib.llm.client._langfuse_imported", False)
+        module = mocker.patch("phoenix_lib.llm.client.langfuse_module")
+        mocker.patch("phoenix_lib.llm.client.callback_handler_cls")
+        client = _make_client(tmp_path)
+        assert client._get_langfuse_client() is module.get_client.return_value
+
+    def test_env_read_at_construction(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LANGCHAIN_TRACING_V2", "off")
+        client = _make_client(tmp_path)
+        monkeypatch.setenv("LANGCHAIN_TRACING_V2", "true")
+        assert client._get_langfuse_client() is None
+
+
+class TestOverrideLlmCache:
+    def test_same_model_string_reuses_instance(self, tmp_path, mocker):
+        llm_cls = mocker.patch("phoenix_lib.llm.client.ChatLiteLLM")
+        client = _make_client(tmp_path)
+        first = client._get_override_llm("openai/gpt-4o")
+        assert client._get_override_llm("openai/gpt-4o") is first
+        llm_cls.assert_called_once_with(model="openai/gpt-4o", callbacks=None)
+
+    def test_configs_keyed_by_model_and_params(self, tmp_path, mocker):
+        llm_cls = mocker.patch("phoenix_lib.llm.client.ChatLiteLLM")
+        client = _make_client(tmp_path)
+        client._get_override_llm(LLMConfig(model="a/b", params={"temperature": 0}))
+        client._get_override_llm(LLMConfig(model="a/b", params={"temperature": 0}))
+        client._get_override_llm(LLMConfig(model="a/b", params={"temperature": 1}))
+        assert llm_cls.call_count == 2
+
+    def test_cache_is_bounded(self, tmp_path, mocker):
+        mocker.patch("phoenix_lib.llm.client.ChatLiteLLM")
+        mocker.patch("phoenix_lib.llm.client._OVERRIDE_LLM_CACHE_SIZE", 2)
+        client = _make_client(tmp_path)
+        for name in ("p/a", "p/b", "p/c"):
+            client._get_override_llm(name)
+        assert list(client._override_llms) == ["p/b", "p/c"]
+
+
+class TestCompileRenderer:
+    def test_static_template_rendered_once(self, mocker):
+        renderer = _compile_renderer("Static prompt with {braces}\n")
+        spy = mocker.spy(PromptTemplate, "format")
+        assert renderer({"braces": "ignored"}) == "Static prompt with {braces}"
+        spy.assert_not_called()
+
+    def test_jinja_template_rendered_per_context(self):
+        renderer = _compile_renderer("Hi {{ who }}")
+        assert renderer({"who": "A"}) == "Hi A"
+        assert renderer({"who": "B"}) == "Hi B"
+
+    def test_jinja_block_not_treated_as_static(self):
+        renderer = _compile_renderer("{% if x %}yes{% endif %}")
+        assert renderer({"x": True}) == "yes"
+        assert renderer({"x": False}) == ""
+
+
+class TestChainCache:
+    def test_chain_reused_for_same_prompt_and_llm(self, tmp_path):
+        client = _make_client(tmp_path)
+        llm = RunnableLambda(lambda value: value)
+        first = client._get_chain("T {{ x }}", llm)
+        assert client._get_chain("T {{ x }}", llm) is first
+
+    def test_new_chain_for_changed_template(self, tmp_path):
+        client = _make_client(tmp_path)
+        llm = RunnableLambda(lambda value: value)
+        assert client._get_chain("A {{ x }}", llm) is not client._get_chain(
+            "B {{ x }}", llm
+        )
+
+    async def test_generate_uses_cached_chain(self, tmp_path, mocker):
+        client = _make_client(tmp_path)
+        mocker.patch.object(
+            client, "_get_default_llm", return_value=RunnableLambda(lambda v: v)
+        )
+        client._tracing_disabled = True
+        assert await client.generate("greet", {"name": "Ada"}) == "Hello, Ada!"
+        assert await client.generate("greet", {"name": "Bob"}) == "Hello, Bob!"
+        assert len(client._chains) == 1
+
+    async def test_request_id_fallback_skipped_when_info_disabled(
+        self, tmp_path, mocker
+    ):
+        client = _make_client(tmp_path)
+        mocker.patch.object(
+            client, "_get_default_llm", return_value=RunnableLambda(lambda v: v)
+        )
+        client._tracing_disabled = True
+        mocker.patch(
+            "phoenix_lib.llm.client.logger.isEnabledFor", return_value=False
+        )
+        timestamp = mocker.patch("phoenix_lib.llm.client.utc_timestamp")
+        await client.generate("greet", {"name": "Ada"})
+        timestamp.assert_not_called()
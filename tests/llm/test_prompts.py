@@ -2,6 +2,7 @@
 
 import pytest
 
+from phoenix_lib.config import yaml_loader
 from phoenix_lib.llm.prompts import PromptLoader
 
 
@@ -66,3 +67,66 @@ class TestPromptLoader:
         loader = PromptLoader(tmp_path)
         result = loader.load("jinja")
         assert "{{ text }}" in result
+
+    def test_unchanged_prompt_parsed_once(self, tmp_path, mocker):
+        (tmp_path / "cached.yaml").write_text("template: cached", encoding="utf-8")
+        spy = mocker.spy(yaml_loader.yaml, "load")
+        loader = PromptLoader(tmp_path)
+        loader.load("cached")
+        loader.load("cached")
+        assert spy.call_count == 1
+
+    def test_modified_prompt_reloaded(self, tmp_path):
+        prompt_file = tmp_path / "edited.yaml"
+        prompt_file.write_text("template: before", encoding="utf-8")
+        loader = PromptLoader(tmp_path)
+        assert loader.load("edited") == "before"
+        prompt_file.write_text("template: after edit", encoding="utf-8")
+        assert loader.load("edited") == "after edit"
+
+    def test_prompt_served_from_json_sidecar(self, tmp_path, mocker, monkeypatch):
+        monkeypatch.setenv(yaml_loader.JSON_SIDECAR_ENV_VAR, "1")
+        (tmp_path / "side.yaml").write_text("template: from sidecar", encoding="utf-8")
+        PromptLoader(tmp_path).load("side")
+        assert (tmp_path / "side.yaml.json").exists()
+        yaml_loader.clear_config_cache()
+        spy = mocker.spy(yaml_loader.yaml, "load")
+        assert PromptLoader(tmp_path).load("side") == "from sidecar"
+        assert spy.call_count == 0
+
+    def test_clear_config_cache_drops_prompts(self, tmp_path):
+        (tmp_path / "shared.yaml").write_text("template: hi", encoding="utf-8")
+        PromptLoader(tmp_path).load("shared")
+        yaml_loader.clear_config_cache()
+        assert yaml_loader.load_yaml_cached.cache_info().currsize == 0
+
+    def test_non_ascii_template_decoded(self, tmp_path):
+        (tmp_path / "unicode.yaml").write_text(
+            "template: Grüße, {{ name }} — café", encoding="utf-8"
+        )
+        loader = PromptLoader(tmp_path)
+        assert loader.load("unicode") == "Grüße, {{ name }} — café"
+
+    def test_preload_warms_cache(self, tmp_path, mocker):
+        (tmp_path / "a.yaml").write_text("template: A", encoding="utf-8")
+        (tmp_path / "b.yaml").write_text("template: B", encoding="utf-8")
+        loader = PromptLoader(tmp_path)
+        loader.preload(["a", "b"])
+        spy = mocker.spy(yaml_loader.yaml, "load")
+        assert loader.load("a") == "A"
+        assert loader.load("b") == "B"
+        assert spy.call_count == 0
+
+    def test_preload_missing_prompt_raises(self, tmp_path):
+        loader = PromptLoader(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            loader.preload(["missing"])
+
+    def test_preload_all_loads_every_yaml(self, tmp_path, mocker):
+        (tmp_path / "one.yaml").write_text("template: 1", encoding="utf-8")
+        (tmp_path / "two.yaml").write_text("template: 2", encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("not a prompt", encoding="utf-8")
+        loader = PromptLoader(tmp_path)
+        load = mocker.spy(loader, "load")
+        loader.preload_all()
+        assert sorted(c.args[0] for c in load.call_args_list) == ["one", "two"]
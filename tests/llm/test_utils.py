@@ -1,5 +1,10 @@
 """Tests for phoenix_lib.llm.utils (normalize_result)."""
 
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
 from phoenix_lib.llm.utils import normalize_result
 
 
@@ -73,6 +78,25 @@ class TestNormalizeResult:
         assert "part1" in result
         assert "part2" in result
 
+    def test_object_with_fenced_string_content_stripped(self):
+        obj = _WithContent("```\nfenced\n```")
+        assert normalize_result(obj) == "fenced"
+
+    # --- Bytes ---
+
+    def test_bytes_decoded(self):
+        assert normalize_result("héllo".encode("utf-8")) == "héllo"
+
+    def test_invalid_utf8_bytes_replaced(self):
+        assert normalize_result(b"ok\xff") == "ok\ufffd"
+
+    def test_dict_subclass_uses_dict_handling(self):
+        class Payload(dict):
+            pass
+
+        payload = Payload(message={"content": "from subclass"})
+        assert normalize_result(payload) == "from subclass"
+
     # --- Objects with .text ---
 
     def test_object_with_text_attr(self):
@@ -143,3 +167,48 @@ class TestNormalizeResult:
 
     def test_plain_text_not_affected_by_fence_strip(self):
         assert normalize_result("just text") == "just text"
+
+    # --- Deep nesting ---
+
+    def test_deeply_nested_content_does_not_recurse(self):
+        # Deep enough to overflow the interpreter stack if walked recursively.
+        obj = "leaf"
+        for _ in range(450):
+            obj = _WithContent([obj])
+        assert normalize_result(obj) == "leaf"
+
+    def test_self_referential_content_terminates(self):
+        obj = _WithContent(None)
+        obj.content = [obj, "tail"]
+        assert normalize_result(obj) == "tail"
+
+    def test_self_referential_dict_terminates(self):
+        payload = {"key": "value"}
+        payload["self"] = payload
+        assert json.loads(normalize_result(payload)) == {"key": "value", "self": ""}
+
+    def test_mock_with_fabricated_attributes_terminates(self):
+        assert normalize_result(MagicMock()) == ""
+
+    def test_shared_sibling_emitted_each_time(self):
+        shared = _WithContent("x")
+        assert normalize_result(_WithContent([shared, shared])) == "x\nx"
+
+    def test_nested_lists_flattened_in_order(self):
+        obj = _WithContent([["a", ["b", ""]], "c", None])
+        assert normalize_result(obj) == "a\nb\nc"
+
+    # --- JSON serialization backend ---
+
+    def test_orjson_output_is_compact(self):
+        pytest.importorskip("orjson")
+        assert normalize_result({"key": "värde"}) == '{"key":"värde"}'
+
+    def test_stdlib_fallback_keeps_default_separators(self, monkeypatch):
+        from phoenix_lib.llm import utils
+
+        monkeypatch.setattr(utils, "orjson", None)
+        assert normalize_result({"key": "värde"}) == '{"key": "värde"}'
+
+    def test_lone_surrogate_falls_back_to_stdlib(self):
+        assert normalize_result({"a": "x\udcff"}) == '{"a": "x\udcff"}'
@@ -1,25 +1,36 @@
 """Tests for phoenix_lib.logging.config."""
 
+import pytest
+
+from phoenix_lib.logging import config
 from phoenix_lib.logging.config import configure_logging, get_logger
 
 
-class TestConfigureLogging:
-    def test_configure_with_info_level(self):
-        # Should not raise
-        configure_logging("INFO")
+@pytest.fixture
+def unconfigured():
+    """Start from an unconfigured module and reset logging again afterwards.
 
-    def test_configure_with_debug_level(self):
-        configure_logging("DEBUG")
+    Not built on monkeypatch: restoring the old ``_CONFIGURED_LEVEL`` would
+    leave it disagreeing with the configuration the test actually applied.
+    """
+    config._CONFIGURED_LEVEL = None
+    yield
+    if config._structlog is not None:
+        config._structlog.reset_defaults()
+    config._cached_logger.cache_clear()
+    config._CONFIGURED_LEVEL = None
 
-    def test_configure_with_warning_level(self):
-        configure_logging("WARNING")
 
-    def test_configure_with_lowercase_level(self):
-        configure_logging("info")
-
-    def test_configure_with_invalid_level_falls_back_to_info(self):
-        # Invalid level string should not raise; getattr returns logging.INFO as fallback
-        configure_logging("NOTAREALEVEL")
+class TestConfigureLogging:
+    # An invalid level string must not raise; it falls back to logging.INFO.
+    @pytest.mark.usefixtures("unconfigured")
+    @pytest.mark.parametrize(
+        "level", ["INFO", "DEBUG", "WARNING", "info", "NOTAREALEVEL"]
+    )
+    def test_configure_accepts_level(self, level, mocker):
+        apply = mocker.spy(config, "_apply_logging_config")
+        configure_logging(level)
+        apply.assert_called_once()
 
     def test_configure_called_multiple_times(self):
         # Should be idempotent (no exception)
@@ -27,16 +38,21 @@ class TestConfigureLogging:
         configure_logging("DEBUG")
         configure_logging("INFO")
 
+    @pytest.mark.usefixtures("unconfigured")
+    def test_same_level_configured_once(self, mocker):
+        apply = mocker.spy(config, "_apply_logging_config")
+        configure_logging("INFO")
+        configure_logging("info")
+        assert apply.call_count == 1
+        configure_logging("DEBUG")
+        assert apply.call_count == 2
+
 
 class TestGetLogger:
-    def test_returns_something_callable(self):
-        logger = get_logger("test.module")
-        assert logger is not None
-
-    def test_logger_name(self):
-        logger = get_logger("my.service")
-        # May be structlog or stdlib adapter — just verify it doesn't crash
-        assert logger is not None
+    # May be structlog or stdlib adapter — just verify it doesn't crash
+    @pytest.mark.parametrize("name", ["test.module", "my.service"])
+    def test_returns_logger(self, name):
+        assert get_logger(name) is not None
 
     def test_logger_can_log_info(self):
         configure_logging("INFO")
@@ -61,3 +77,22 @@ class TestGetLogger:
         logger_b = get_logger("module.b")
         assert logger_a is not None
         assert logger_b is not None
+
+    def test_same_name_returns_same_logger(self):
+        assert get_logger("cached.module") is get_logger("cached.module")
+
+    @pytest.mark.usefixtures("unconfigured")
+    def test_reconfigure_applies_new_level_to_cached_name(self, capsys):
+        configure_logging("WARNING")
+        get_logger("reconfigured.module").debug("hidden")
+        configure_logging("DEBUG")
+        get_logger("reconfigured.module").debug("shown")
+        out = capsys.readouterr().out
+        assert "shown" in out
+        assert "hidden" not in out
+
+    def test_stdlib_fallback_accepts_keyword_args(self, monkeypatch):
+        monkeypatch.setattr(config, "_USE_STRUCTLOG", False)
+        logger = get_logger("fallback.logger")
+        assert isinstance(logger, config._StdlibAdapter)
+        logger.info("message", key="value")
@@ -1,167 +1,151 @@
 """Tests for phoenix_lib.observability.sentry."""
 
-from unittest.mock import patch
+import importlib.util
+from unittest.mock import Mock
 
 import pytest
 
 from phoenix_lib.observability.sentry import init_sentry
 
+_HAS_ASYNCPG = importlib.util.find_spec("asyncpg") is not None
+
+
+def _integration_names(mock_init):
+    """Return the class names of the integrations passed to ``sentry_sdk.init``."""
+    integrations = mock_init.call_args.kwargs["integrations"]
+    return frozenset(type(i).__name__ for i in integrations)
+
+
+@pytest.fixture
+def sentry_mocks(monkeypatch):
+    """Replace ``sentry_sdk.init`` and ``sentry_sdk.set_tag`` with mocks."""
+    # Imported here so collecting this module does not load sentry_sdk,
+    # matching init_sentry(), which imports it on first real use.
+    import sentry_sdk  # pylint: disable=import-outside-toplevel
+
+    # Plain Mocks specced on the real functions: no magic-method wiring, and
+    # a typo'd assertion attribute raises instead of silently passing.
+    mock_init = Mock(spec=sentry_sdk.init)
+    mock_tag = Mock(spec=sentry_sdk.set_tag)
+    monkeypatch.setattr(sentry_sdk, "init", mock_init)
+    monkeypatch.setattr(sentry_sdk, "set_tag", mock_tag)
+    return mock_init, mock_tag
+
 
 class TestInitSentry:
-    def test_no_dsn_does_not_init(self):
-        with patch("sentry_sdk.init") as mock_init:
-            init_sentry(dsn=None, service_name="test-service")
-            mock_init.assert_not_called()
-
-    def test_empty_dsn_does_not_init(self):
-        with patch("sentry_sdk.init") as mock_init:
-            init_sentry(dsn="", service_name="test-service")
-            mock_init.assert_not_called()
-
-    def test_disabled_does_not_init(self):
-        with patch("sentry_sdk.init") as mock_init:
-            init_sentry(
-                dsn="https://key@sentry.io/123",
-                service_name="test-service",
-                enabled=False,
-            )
-            mock_init.assert_not_called()
-
-    def test_valid_dsn_calls_init(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(dsn="https://key@sentry.io/123", service_name="test-service")
-            mock_init.assert_called_once()
-
-    def test_sets_service_tag(self):
-        with (
-            patch("sentry_sdk.init"),
-            patch("sentry_sdk.set_tag") as mock_tag,
-        ):
-            init_sentry(dsn="https://key@sentry.io/123", service_name="my-service")
-            mock_tag.assert_called_once_with("service", "my-service")
-
-    def test_passes_environment(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(
-                dsn="https://key@sentry.io/123",
-                service_name="svc",
-                environment="staging",
-            )
-            call_kwargs = mock_init.call_args.kwargs
-            assert call_kwargs["environment"] == "staging"
-
-    def test_passes_release(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(
-                dsn="https://key@sentry.io/123",
-                service_name="svc",
-                release="v1.2.3",
-            )
-            call_kwargs = mock_init.call_args.kwargs
-            assert call_kwargs["release"] == "v1.2.3"
-
-    def test_gdpr_settings_applied(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(dsn="https://key@sentry.io/123", service_name="svc")
-            call_kwargs = mock_init.call_args.kwargs
-            assert call_kwargs["send_default_pii"] is False
-            assert call_kwargs["attach_stacktrace"] is True
-
-    def test_sample_rates_passed(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(
-                dsn="https://key@sentry.io/123",
-                service_name="svc",
-                traces_sample_rate=0.5,
-                profiles_sample_rate=0.25,
-            )
-            call_kwargs = mock_init.call_args.kwargs
-            assert call_kwargs["traces_sample_rate"] == 0.5
-            assert call_kwargs["profiles_sample_rate"] == 0.25
-
-    def test_default_integrations_include_fastapi_and_logging(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(
-                dsn="https://key@sentry.io/123", service_name="svc", use_aiohttp=False
-            )
-            integrations = mock_init.call_args.kwargs["integrations"]
-            class_names = [type(i).__name__ for i in integrations]
-            assert "FastApiIntegration" in class_names
-            assert "StarletteIntegration" in class_names
-            assert "LoggingIntegration" in class_names
-
-    def test_use_aiohttp_adds_aiohttp_integration(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(
-                dsn="https://key@sentry.io/123", service_name="svc", use_aiohttp=True
-            )
-            integrations = mock_init.call_args.kwargs["integrations"]
-            class_names = [type(i).__name__ for i in integrations]
-            assert "AioHttpIntegration" in class_names
-
-    def test_use_aiohttp_false_omits_aiohttp(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(
-                dsn="https://key@sentry.io/123", service_name="svc", use_aiohttp=False
-            )
-            integrations = mock_init.call_args.kwargs["integrations"]
-            class_names = [type(i).__name__ for i in integrations]
-            assert "AioHttpIntegration" not in class_names
-
-    @pytest.mark.skipif(
-        not __import__("importlib").util.find_spec("asyncpg"),
-        reason="asyncpg not installed",
-    )
-    def test_use_asyncpg_adds_asyncpg_integration(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(
-                dsn="https://key@sentry.io/123",
-                service_name="svc",
-                use_asyncpg=True,
-                use_aiohttp=False,
-            )
-            integrations = mock_init.call_args.kwargs["integrations"]
-            class_names = [type(i).__name__ for i in integrations]
-            assert "AsyncPGIntegration" in class_names
-
-    def test_use_asyncpg_false_omits_asyncpg(self):
-        with (
-            patch("sentry_sdk.init") as mock_init,
-            patch("sentry_sdk.set_tag"),
-        ):
-            init_sentry(
-                dsn="https://key@sentry.io/123",
-                service_name="svc",
-                use_asyncpg=False,
-                use_aiohttp=False,
-            )
-            integrations = mock_init.call_args.kwargs["integrations"]
-            class_names = [type(i).__name__ for i in integrations]
-            assert "AsyncPGIntegration" not in class_names
+    def test_no_dsn_does_not_init(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(dsn=None, service_name="test-service")
+        mock_init.assert_not_called()
+
+    def test_empty_dsn_does_not_init(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(dsn="", service_name="test-service")
+        mock_init.assert_not_called()
+
+    def test_disabled_does_not_init(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123",
+            service_name="test-service",
+            enabled=False,
+        )
+        mock_init.assert_not_called()
+
+    def test_valid_dsn_calls_init(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(dsn="https://key@sentry.io/123", service_name="test-service")
+        mock_init.assert_called_once()
+
+    def test_sets_service_tag(self, sentry_mocks):
+        _, mock_tag = sentry_mocks
+        init_sentry(dsn="https://key@sentry.io/123", service_name="my-service")
+        mock_tag.assert_called_once_with("service", "my-service")
+
+    def test_passes_environment(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123",
+            service_name="svc",
+            environment="staging",
+        )
+        call_kwargs = mock_init.call_args.kwargs
+        assert call_kwargs["environment"] == "staging"
+
+    def test_passes_release(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123",
+            service_name="svc",
+            release="v1.2.3",
+        )
+        call_kwargs = mock_init.call_args.kwargs
+        assert call_kwargs["release"] == "v1.2.3"
+
+    def test_gdpr_settings_applied(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(dsn="https://key@sentry.io/123", service_name="svc")
+        call_kwargs = mock_init.call_args.kwargs
+        assert call_kwargs["send_default_pii"] is False
+        assert call_kwargs["attach_stacktrace"] is True
+
+    def test_sample_rates_passed(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123",
+            service_name="svc",
+            traces_sample_rate=0.5,
+            profiles_sample_rate=0.25,
+        )
+        call_kwargs = mock_init.call_args.kwargs
+        assert call_kwargs["traces_sample_rate"] == 0.5
+        assert call_kwargs["profiles_sample_rate"] == 0.25
+
+    def test_default_integrations_include_fastapi_and_logging(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123", service_name="svc", use_aiohttp=False
+        )
+        class_names = _integration_names(mock_init)
+        assert "FastApiIntegration" in class_names
+        assert "StarletteIntegration" in class_names
+        assert "LoggingIntegration" in class_names
+
+    def test_use_aiohttp_adds_aiohttp_integration(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123", service_name="svc", use_aiohttp=True
+        )
+        class_names = _integration_names(mock_init)
+        assert "AioHttpIntegration" in class_names
+
+    def test_use_aiohttp_false_omits_aiohttp(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123", service_name="svc", use_aiohttp=False
+        )
+        class_names = _integration_names(mock_init)
+        assert "AioHttpIntegration" not in class_names
+
+    @pytest.mark.skipif(not _HAS_ASYNCPG, reason="asyncpg not installed")
+    def test_use_asyncpg_adds_asyncpg_integration(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123",
+            service_name="svc",
+            use_asyncpg=True,
+            use_aiohttp=False,
+        )
+        class_names = _integration_names(mock_init)
+        assert "AsyncPGIntegration" in class_names
+
+    def test_use_asyncpg_false_omits_asyncpg(self, sentry_mocks):
+        mock_init, _ = sentry_mocks
+        init_sentry(
+            dsn="https://key@sentry.io/123",
+            service_name="svc",
+            use_asyncpg=False,
+            use_aiohttp=False,
+        )
+        class_names = _integration_names(mock_init)
+        assert "AsyncPGIntegration" not in class_names
@@ -0,0 +1,66 @@
+"""Shared fixtures for the schema tests."""
+
+import uuid
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+import pytest
+
+# Only used to satisfy datetime fields; freshness is irrelevant.
+_NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def now():
+    """The single timestamp shared by all schema tests."""
+    return _NOW
+
+
+@pytest.fixture(scope="session")
+def job_listing_defaults(now):
+    """Read-only field values for a valid ``JobListingResponse``."""
+    return MappingProxyType(
+        {
+            "id": uuid.uuid4(),
+            "external_id": "ext-001",
+            "source": "linkedin",
+            "source_job_id": "job-001",
+            "url": "https://linkedin.com/jobs/1",
+            "title": "Software Engineer",
+            "company": "Acme Corp",
+            "location": "Remote",
+            "description": "Great job",
+            "snippet": "snippet",
+            "posted_at": now,
+            "salary_min": None,
+            "salary_max": None,
+            "salary_currency": None,
+            "employment_type": "full-time",
+            "remote_type": "remote",
+            "content_hash": "abc123",
+            "first_seen_at": now,
+            "last_seen_at": now,
+            "created_at": now,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def job_match_defaults(now):
+    """Read-only field values for a valid ``JobMatchResponse``."""
+    return MappingProxyType(
+        {
+            "id": uuid.uuid4(),
+            "job_alert_id": uuid.uuid4(),
+            "job_listing_id": uuid.uuid4(),
+            "user_id": uuid.uuid4(),
+            "relevance_score": 85,
+            "key_strengths": ("Python", "FastAPI"),
+            "potential_concerns": (),
+            "strategic_value": "High",
+            "recommended_action": "Apply",
+            "reasoning": "Strong match",
+            "is_notified": False,
+            "created_at": now,
+        }
+    )
@@ -100,6 +100,15 @@ class TestJobDescriptionSchema:
         job = JobDescriptionSchema(title="Dev", remote="Hybrid")
         assert job.remote == Remote.Hybrid
 
+    def test_remote_stored_as_plain_string(self):
+        job = JobDescriptionSchema(title="Dev", remote=Remote.None_)
+        assert type(job.remote) is str
+        assert job.model_dump()["remote"] == "None"
+
+    def test_invalid_remote_rejected(self):
+        with pytest.raises(ValidationError):
+            JobDescriptionSchema(title="Dev", remote="Sometimes")
+
     def test_with_skills_list(self):
         job = JobDescriptionSchema(
             title="Engineer",
@@ -160,6 +169,11 @@ class TestGetJobSchemaParser:
         parser = get_job_schema_parser()
         assert parser.pydantic_object is JobDescriptionSchema
 
+    def test_parser_cached(self):
+        from phoenix_lib.schemas.job import get_job_schema_parser
+
+        assert get_job_schema_parser() is get_job_schema_parser()
+
 
 class TestGetJobSchemaFormatInstructions:
     def test_returns_string(self):
@@ -168,3 +182,11 @@ class TestGetJobSchemaFormatInstructions:
         instructions = get_job_schema_format_instructions()
         assert isinstance(instructions, str)
         assert len(instructions) > 0
+
+    def test_instructions_cached(self):
+        from phoenix_lib.schemas.job import get_job_schema_format_instructions
+
+        assert (
+            get_job_schema_format_instructions()
+            is get_job_schema_format_instructions()
+        )
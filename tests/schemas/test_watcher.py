@@ -1,7 +1,8 @@
 """Tests for phoenix_lib.schemas.watcher (inter-service contract DTOs)."""
 
+import itertools
 import uuid
-from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pytest
 from pydantic import ValidationError
@@ -14,11 +15,18 @@ from phoenix_lib.schemas.watcher import (JobAlertCreate, JobAlertUpdate,
                                          ProcessAlertRequest,
                                          ProcessAlertResponse)
 
+_uid_counter = itertools.count(1)
+
+
+def _uid() -> uuid.UUID:
+    """Return a unique, deterministic UUID (validation does not need entropy)."""
+    return uuid.UUID(int=next(_uid_counter))
+
 
 class TestJobAlertCreate:
     def test_minimal_with_string_keywords(self):
         obj = JobAlertCreate(keywords="python developer")
-        assert obj.keywords == "python developer"
+        assert obj.keywords == ["python developer"]
 
     def test_keywords_as_list(self):
         obj = JobAlertCreate(keywords=["python", "django"])
@@ -66,6 +74,14 @@ class TestJobAlertUpdate:
         obj = JobAlertUpdate(keywords=["java", "spring"])
         assert obj.keywords == ["java", "spring"]
 
+    def test_string_keywords_in_update(self):
+        obj = JobAlertUpdate(keywords="java")
+        assert obj.keywords == ["java"]
+
+    def test_keywords_reject_non_string_items(self):
+        with pytest.raises(ValidationError):
+            JobAlertUpdate(keywords=[{"bad": "value"}])
+
 
 class TestLinkedInCookieCreate:
     def test_required_li_at(self):
@@ -90,70 +106,71 @@ class TestLinkedInCookieCreate:
 
 
 class TestJobListingResponse:
+    @pytest.fixture(autouse=True)
+    def _use_defaults(self, job_listing_defaults):
+        self._defaults = job_listing_defaults
+
     def _make(self, **kwargs):
-        now = datetime.now(timezone.utc)
-        defaults = {
-            "id": uuid.uuid4(),
-            "external_id": "ext-001",
-            "source": "linkedin",
-            "source_job_id": "job-001",
-            "url": "https://linkedin.com/jobs/1",
-            "title": "Software Engineer",
-            "company": "Acme Corp",
-            "location": "Remote",
-            "description": "Great job",
-            "snippet": "snippet",
-            "posted_at": now,
-            "salary_min": None,
-            "salary_max": None,
-            "salary_currency": None,
-            "employment_type": "full-time",
-            "remote_type": "remote",
-            "content_hash": "abc123",
-            "first_seen_at": now,
-            "last_seen_at": now,
-            "created_at": now,
-        }
-        defaults.update(kwargs)
-        return JobListingResponse(**defaults)
+        return JobListingResponse(**{**self._defaults, **kwargs})
 
     def test_valid_creation(self):
         obj = self._make()
         assert obj.title == "Software Engineer"
 
     def test_optional_fields_none(self):
-        obj = self._make(company=None, location=None, description=None)
-        assert obj.company is None
+        optional = (
+            "company",
+            "location",
+            "description",
+            "snippet",
+            "posted_at",
+            "salary_min",
+            "salary_max",
+            "salary_currency",
+            "employment_type",
+            "remote_type",
+        )
+        obj = self._make(**dict.fromkeys(optional))
+        assert all(getattr(obj, name) is None for name in optional)
 
     def test_embedding_model_optional(self):
         obj = self._make(embedding_model="text-embedding-3-small")
         assert obj.embedding_model == "text-embedding-3-small"
 
     def test_uuid_id_field(self):
-        uid = uuid.uuid4()
+        uid = _uid()
         obj = self._make(id=uid)
         assert obj.id == uid
 
+    def test_frozen(self):
+        obj = self._make()
+        with pytest.raises(ValidationError):
+            obj.title = "Other"
+
+    def test_from_row_matches_validated(self):
+        row = SimpleNamespace(**self._make().model_dump(), _sa_instance_state=object())
+        obj = JobListingResponse.from_row(row)
+        assert obj == JobListingResponse.model_validate(row)
+        assert obj.embedding_model is None
+
+    def test_list_from_json(self):
+        first, second = self._make(title="A"), self._make(title="B")
+        payload = "[" + first.model_dump_json() + "," + second.model_dump_json() + "]"
+        result = JobListingResponse.list_from_json(payload.encode())
+        assert result == [first, second]
+
+    def test_list_from_json_validates(self):
+        with pytest.raises(ValidationError):
+            JobListingResponse.list_from_json(b'[{"id": "not-a-uuid"}]')
+
 
 class TestJobMatchResponse:
+    @pytest.fixture(autouse=True)
+    def _use_defaults(self, job_match_defaults):
+        self._defaults = job_match_defaults
+
     def _make(self, **kwargs):
-        now = datetime.now(timezone.utc)
-        defaults = {
-            "id": uuid.uuid4(),
-            "job_alert_id": uuid.uuid4(),
-            "job_listing_id": uuid.uuid4(),
-            "user_id": uuid.uuid4(),
-            "relevance_score": 85,
-            "key_strengths": ["Python", "FastAPI"],
-            "potential_concerns": [],
-            "strategic_value": "High",
-            "recommended_action": "Apply",
-            "reasoning": "Strong match",
-            "is_notified": False,
-            "created_at": now,
-        }
-        defaults.update(kwargs)
-        return JobMatchResponse(**defaults)
+        return JobMatchResponse(**{**self._defaults, **kwargs})
 
     def test_valid_creation(self):
         obj = self._make()
@@ -172,47 +189,48 @@ class TestJobMatchWithListing:
     def test_inherits_from_job_match_response(self):
         assert issubclass(JobMatchWithListing, JobMatchResponse)
 
-    def test_includes_job_listing(self):
-        now = datetime.now(timezone.utc)
-        listing = JobListingResponse(
-            id=uuid.uuid4(),
-            external_id="ext-1",
-            source="linkedin",
-            source_job_id="job-1",
-            url="https://example.com",
-            title="Dev",
-            company=None,
-            location=None,
-            description=None,
-            snippet=None,
-            posted_at=None,
-            salary_min=None,
-            salary_max=None,
-            salary_currency=None,
-            employment_type=None,
-            remote_type=None,
-            content_hash="hash",
-            first_seen_at=now,
-            last_seen_at=now,
-            created_at=now,
+    def test_includes_job_listing(self, job_listing_defaults, job_match_defaults):
+        # The listing is only an input here; its validation is covered by
+        # TestJobListingResponse, so build it without re-validating.
+        listing = JobListingResponse.model_construct(
+            **{**job_listing_defaults, "title": "Dev"}
         )
         match = JobMatchWithListing(
-            id=uuid.uuid4(),
-            job_alert_id=uuid.uuid4(),
-            job_listing_id=listing.id,
-            user_id=uuid.uuid4(),
-            relevance_score=90,
-            key_strengths=["Python"],
-            potential_concerns=[],
-            strategic_value=None,
-            recommended_action=None,
-            reasoning=None,
-            is_notified=False,
-            created_at=now,
+            **{**job_match_defaults, "job_listing_id": listing.id},
             job_listing=listing,
         )
         assert match.job_listing.title == "Dev"
 
+    def test_from_row_builds_nested_listing(
+        self, job_listing_defaults, job_match_defaults
+    ):
+        listing_row = SimpleNamespace(**{**job_listing_defaults, "title": "Dev"})
+        # ORM rows hold lists; the shared defaults use tuples to stay read-only.
+        match_row = SimpleNamespace(
+            **{
+                **job_match_defaults,
+                "key_strengths": list(job_match_defaults["key_strengths"]),
+                "potential_concerns": list(job_match_defaults["potential_concerns"]),
+                "job_listing_id": listing_row.id,
+            },
+            job_listing=listing_row,
+        )
+        match = JobMatchWithListing.from_row(match_row)
+        assert isinstance(match.job_listing, JobListingResponse)
+        assert match.job_listing.title == "Dev"
+        assert match.model_dump()["job_listing"]["url"] == listing_row.url
+
+    def test_from_row_missing_required_field_raises(
+        self, job_listing_defaults, job_match_defaults
+    ):
+        listing_fields = dict(job_listing_defaults)
+        del listing_fields["company"]
+        match_row = SimpleNamespace(
+            **job_match_defaults, job_listing=SimpleNamespace(**listing_fields)
+        )
+        with pytest.raises(AttributeError, match="company"):
+            JobMatchWithListing.from_row(match_row)
+
 
 class TestProcessAlertRequest:
     def test_requires_alert_id(self):
@@ -220,11 +238,11 @@ class TestProcessAlertRequest:
             ProcessAlertRequest()
 
     def test_default_min_relevance(self):
-        obj = ProcessAlertRequest(alert_id=uuid.uuid4())
+        obj = ProcessAlertRequest(alert_id=_uid())
         assert obj.min_relevance_score == 60
 
     def test_custom_min_relevance(self):
-        obj = ProcessAlertRequest(alert_id=uuid.uuid4(), min_relevance_score=75)
+        obj = ProcessAlertRequest(alert_id=_uid(), min_relevance_score=75)
         assert obj.min_relevance_score == 75
 
 
@@ -250,6 +268,6 @@ class TestMarkNotifiedRequest:
             MarkNotifiedRequest()
 
     def test_valid_uuid(self):
-        uid = uuid.uuid4()
+        uid = _uid()
         obj = MarkNotifiedRequest(match_id=uid)
         assert obj.match_id == uid
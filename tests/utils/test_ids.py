@@ -2,6 +2,9 @@
 
 import string
 
+import pytest
+
+from phoenix_lib.utils import ids
 from phoenix_lib.utils.ids import short_id
 
 
@@ -10,10 +13,9 @@ class TestShortId:
         result = short_id()
         assert len(result) == 8
 
-    def test_custom_length(self):
-        assert len(short_id(length=4)) == 4
-        assert len(short_id(length=16)) == 16
-        assert len(short_id(length=1)) == 1
+    @pytest.mark.parametrize("length", [1, 4, 16])
+    def test_custom_length(self, length):
+        assert len(short_id(length=length)) == length
 
     def test_zero_length(self):
         assert short_id(length=0) == ""
@@ -37,3 +39,18 @@ class TestShortId:
         assert len(result) == 128
         assert result.isalnum()
         assert result == result.lower()
+
+    def test_uses_full_alphabet(self):
+        seen = set("".join(short_id(32) for _ in range(200)))
+        assert seen == set(string.ascii_lowercase + string.digits)
+
+    def test_batch_generation(self):
+        result = short_id(10_000)
+        assert len(result) == 10_000
+        assert set(result).issubset(set(string.ascii_lowercase + string.digits))
+
+    def test_rejected_bytes_are_skipped(self, monkeypatch):
+        # Bytes >= 252 would bias the alphabet; they must be drawn again.
+        draws = iter([bytes([255, 0, 253, 35]), bytes(range(36))])
+        monkeypatch.setattr(ids.secrets, "token_bytes", lambda n: next(draws))
+        assert short_id(4) == "a9ab"
@@ -2,9 +2,17 @@
 
 from datetime import datetime, timezone
 
+import pytest
+
 from phoenix_lib.utils.time import utc_timestamp
 
 
+@pytest.fixture(scope="module")
+def dt_tools():
+    """Clock, UTC zone and ISO parser shared by the ordering tests."""
+    return datetime.now, timezone.utc, datetime.fromisoformat
+
+
 class TestUtcTimestamp:
     def test_returns_string(self):
         assert isinstance(utc_timestamp(), str)
@@ -22,16 +30,15 @@ class TestUtcTimestamp:
         assert parsed.tzinfo is not None
         assert parsed.utcoffset().total_seconds() == 0
 
-    def test_recent_timestamp(self):
-        before = datetime.now(timezone.utc)
+    def test_recent_timestamp(self, dt_tools):
+        now, utc, parse = dt_tools
+        before = now(utc)
         ts = utc_timestamp()
-        after = datetime.now(timezone.utc)
-        parsed = datetime.fromisoformat(ts)
-        assert before <= parsed <= after
+        after = now(utc)
+        assert before <= parse(ts) <= after
 
-    def test_successive_calls_are_ordered(self):
+    def test_successive_calls_are_ordered(self, dt_tools):
+        _, _, parse = dt_tools
         ts1 = utc_timestamp()
         ts2 = utc_timestamp()
-        parsed1 = datetime.fromisoformat(ts1)
-        parsed2 = datetime.fromisoformat(ts2)
-        assert parsed1 <= parsed2
+        assert parse(ts1) <= parse(ts2)